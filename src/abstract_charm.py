@@ -9,6 +9,7 @@ import typing
 
 import ops
 
+import cluster_set_routers
 import container
 import lifecycle
 import logrotate
@@ -44,6 +45,7 @@ class MySQLRouterCharm(ops.CharmBase, abc.ABC):
         self._database_requires = relations.database_requires.RelationEndpoint(self)
         self._database_provides = relations.database_provides.RelationEndpoint(self)
         self._cos_relation = relations.cos.COSRelation(self, self._container)
+        self.cluster_set_routers = cluster_set_routers.Cache(self)
         self._ha_cluster = None
         self.framework.observe(self.on.update_status, self.reconcile)
         self.framework.observe(
@@ -323,6 +325,10 @@ class MySQLRouterCharm(ops.CharmBase, abc.ABC):
             f"{self._cos_relation.is_relation_breaking(event)=}"
         )
 
+        if isinstance(workload_, workload.AuthenticatedWorkload) and workload_.container_ready:
+            # Status is set after reconcile
+            workload_.prefetch_status()
+
         # only in machine charms
         if self._ha_cluster:
             self._ha_cluster.set_vip(self.config.get("vip"))
@@ -351,6 +357,7 @@ class MySQLRouterCharm(ops.CharmBase, abc.ABC):
                     )
                     self._update_endpoints()
 
+            self.tls.check_config()
             if workload_.container_ready:
                 workload_.reconcile(
                     event=event,
@@ -25,6 +25,7 @@ import logrotate
 import machine_logrotate
 import machine_upgrade
 import machine_workload
+import mysql_shell
 import relations.database_providers_wrapper
 import relations.hacluster
 import snap
@@ -40,6 +41,7 @@ logger = logging.getLogger(__name__)
         logrotate.LogRotate,
         machine_upgrade.Upgrade,
         machine_workload.AuthenticatedMachineWorkload,
+        mysql_shell.Shell,
         relations.cos.COSRelation,
         relations.database_providers_wrapper.RelationEndpoint,
         relations.database_requires.RelationEndpoint,
@@ -154,7 +156,9 @@ class MachineSubordinateRouterCharm(abstract_charm.MySQLRouterCharm):
             for attempt in tenacity.Retrying(
                 reraise=True,
                 stop=tenacity.stop_after_delay(30),
-                wait=tenacity.wait_fixed(5),
+                # MySQL Router is usually ready in less than a second. Retry quickly at first
+                # (0.05s, 0.1s, 0.2s, ...)
+                wait=tenacity.wait_exponential(multiplier=0.05, max=2),
             ):
                 with attempt:
                     if self.is_externally_accessible(event=event):
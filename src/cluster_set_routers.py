@@ -0,0 +1,74 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Whether MySQL Router is in InnoDB ClusterSet, cached locally on each unit
+
+Each unit checks whether its MySQL Router is part of the ClusterSet when it reports status (e.g.
+on every update-status event). Listing the routers in the ClusterSet queries the cluster metadata.
+
+To avoid one query per update-status interval, each unit caches (in its local charm state) when it
+last found its MySQL Router in the ClusterSet and queries the cluster metadata again at most once
+per TTL. The cache is not shared between units—each unit queries the cluster metadata once per TTL.
+"""
+
+import logging
+import time
+import typing
+
+import ops
+
+if typing.TYPE_CHECKING:
+    import abstract_charm
+    import mysql_shell
+
+logger = logging.getLogger(__name__)
+
+
+class Cache(ops.Object):
+    """Whether MySQL Router is in InnoDB ClusterSet, cached locally on this unit"""
+
+    _TTL_CONFIG_OPTION = "cluster-status-cache-ttl"
+
+    _stored = ops.StoredState()
+
+    def __init__(self, charm_: "abstract_charm.MySQLRouterCharm") -> None:
+        super().__init__(charm_, "cluster-set-routers-cache")
+        self._charm = charm_
+        # Router ID found in the cluster metadata & time of the query
+        self._stored.set_default(router_id=None, found_at=None)
+
+    @property
+    def _ttl(self) -> int:
+        """Seconds until the cluster metadata is queried again"""
+        return int(self._charm.config.get(self._TTL_CONFIG_OPTION, 0))
+
+    def _is_cached(self, router_id: str) -> bool:
+        """Whether router was found in the cluster metadata less than TTL ago
+
+        Only the presence of a router is cached. If the router was not found, the cluster metadata
+        is queried on every check (e.g. until the unit is removed after the router was manually
+        removed from the ClusterSet).
+        """
+        return (
+            self._ttl > 0
+            and self._stored.router_id == router_id
+            and self._stored.found_at is not None
+            and time.time() - self._stored.found_at <= self._ttl
+        )
+
+    def prefetch(self, router_id: str, *, shell: "mysql_shell.Shell") -> None:
+        """Start querying the cluster metadata in the background, if the cache cannot be used."""
+        if not self._is_cached(router_id):
+            shell.prefetch_router_ids_in_cluster_set()
+
+    def is_router_in_cluster_set(self, router_id: str, *, shell: "mysql_shell.Shell") -> bool:
+        """Check if MySQL Router is part of InnoDB ClusterSet."""
+        if self._is_cached(router_id):
+            logger.debug(f"Using cached ClusterSet membership of {router_id=}")
+            return True
+        if router_id in shell.get_router_ids_in_cluster_set():
+            if self._ttl > 0:
+                self._stored.router_id = router_id
+                self._stored.found_at = time.time()
+            return True
+        return False
@@ -10,6 +10,8 @@ import typing
 
 import ops
 
+import router_config
+
 if typing.TYPE_CHECKING:
     import relations.cos
 
@@ -38,6 +40,10 @@ class Path(pathlib.PurePosixPath, abc.ABC):
     def write_text(self, data: str):
         """Open the file in text mode, write to it, and close the file."""
 
+    @abc.abstractmethod
+    def replace(self, target: "Path"):
+        """Rename this file to `target`, atomically replacing `target` if it exists."""
+
     @abc.abstractmethod
     def unlink(self, *, missing_ok=False):
         """Remove this file or link."""
@@ -77,6 +83,13 @@ class Container(abc.ABC):
         """
         return self.router_config_directory / "mysqlrouter.conf"
 
+    @property
+    def router_config(self) -> "router_config.RouterConfig":
+        """MySQL Router configuration file, read once per Juju event"""
+        if self._router_config is None:
+            self._router_config = router_config.RouterConfig(self.router_config_file)
+        return self._router_config
+
     @property
     def rest_api_credentials_file(self) -> Path:
         """Credentials file for MySQL Router's REST API"""
@@ -104,6 +117,7 @@ class Container(abc.ABC):
         self._mysql_shell_command = mysql_shell_command
         self._mysql_router_password_command = mysql_router_password_command
         self._unit_name = unit_name
+        self._router_config: typing.Optional[router_config.RouterConfig] = None
 
     @property
     @abc.abstractmethod
@@ -113,6 +127,19 @@ class Container(abc.ABC):
         Only applies to Kubernetes charm
         """
 
+    @property
+    @abc.abstractmethod
+    def installed_revision(self) -> typing.Optional[str]:
+        """Installed workload revision
+
+        Only applies to machine charm
+        """
+
+    @property
+    @abc.abstractmethod
+    def mysql_router_service_max_open_files(self) -> typing.Optional[int]:
+        """Open files limit of MySQL Router service (`None` if unlimited)"""
+
     @property
     @abc.abstractmethod
     def mysql_router_service_enabled(self) -> bool:
@@ -211,6 +238,23 @@ class Container(abc.ABC):
         args.insert(0, self._mysql_shell_command)
         return self._run_command(args, timeout=timeout, input=input)
 
+    @abc.abstractmethod
+    # TODO python3.10 min version: Use `list` instead of `typing.List`
+    def _start_command(self, command: typing.List[str]) -> subprocess.Popen:
+        """Start long-running command in container.
+
+        stdin, stdout & stderr of the returned process are pipes opened in text mode.
+        """
+
+    # TODO python3.10 min version: Use `list` instead of `typing.List`
+    def start_mysql_shell(self, args: typing.List[str]) -> subprocess.Popen:
+        """Start long-running MySQL Shell process.
+
+        stdin, stdout & stderr of the returned process are pipes opened in text mode.
+        """
+        args.insert(0, self._mysql_shell_command)
+        return self._start_command(args)
+
     @abc.abstractmethod
     def path(self, *args) -> Path:
         """Container filesystem path"""
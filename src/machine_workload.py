@@ -3,12 +3,11 @@
 
 """MySQl Router workload with Unix sockets enabled"""
 
-import configparser
-import io
 import logging
 import pathlib
 import typing
 
+import router_config
 import workload
 
 if typing.TYPE_CHECKING:
@@ -16,6 +15,15 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Routing sections created by MySQL Router bootstrap
+# (section name: (Unix socket file name, TCP port))
+_BOOTSTRAP_ROUTING_SECTIONS = {
+    "routing:bootstrap_rw": ("mysql.sock", 6446),
+    "routing:bootstrap_ro": ("mysqlro.sock", 6447),
+    "routing:bootstrap_x_rw": ("mysqlx.sock", 6448),
+    "routing:bootstrap_x_ro": ("mysqlxro.sock", 6449),
+}
+
 
 class AuthenticatedMachineWorkload(workload.AuthenticatedWorkload):
     """Workload with connection to MySQL cluster and with Unix sockets enabled"""
@@ -53,19 +61,67 @@ class AuthenticatedMachineWorkload(workload.AuthenticatedWorkload):
         must be accessible to applications related via database_provides endpoint.
         """
         logger.debug("Updating configured socket file locations")
-        config = configparser.ConfigParser()
-        config.read_string(self._container.router_config_file.read_text())
-        for section_name, section in config.items():
-            if not section_name.startswith("routing:"):
-                continue
-            section["socket"] = str(
-                self._container.path("/run/mysqlrouter") / pathlib.PurePath(section["socket"]).name
+        config = self._container.router_config
+        for section in config.routes:
+            config.set(
+                section,
+                "socket",
+                str(
+                    self._container.path("/run/mysqlrouter")
+                    / pathlib.PurePath(config.get(section, "socket")).name
+                ),
             )
-        with io.StringIO() as output:
-            config.write(output)
-            self._container.router_config_file.write_text(output.getvalue())
+        config.save()
         logger.debug("Updated configured socket file locations")
 
+    def _get_default_server_ssl_mode(self, *, is_charm_exposed: typing.Optional[bool]) -> str:
+        if is_charm_exposed:
+            return super()._get_default_server_ssl_mode(is_charm_exposed=is_charm_exposed)
+        # Workaround for https://bugs.mysql.com/bug.php?id=107291 (see `_get_bootstrap_command`)
+        return "PREFERRED"
+
+    @staticmethod
+    def _configure_exposure(
+        config: router_config.RouterConfig,
+        *,
+        is_charm_exposed: bool,
+        socket_directory: pathlib.PurePath,
+    ) -> bool:
+        """Update routing sections of MySQL Router config for TCP or Unix sockets.
+
+        Equivalent to bootstrapping with `--conf-bind-address 0.0.0.0` (if exposed) or with
+        `--conf-use-sockets` & `--conf-skip-tcp` (if not exposed)
+
+        Returns `False` if the config contains routing sections not created by bootstrap
+        """
+        if unknown_routes := set(config.routes) - set(_BOOTSTRAP_ROUTING_SECTIONS):
+            logger.debug(f"Unable to reconfigure {unknown_routes=}")
+            return False
+        for section in config.routes:
+            socket_file_name, port = _BOOTSTRAP_ROUTING_SECTIONS[section]
+            if is_charm_exposed:
+                config.remove(section, "socket")
+                config.set(section, "bind_address", "0.0.0.0")
+                config.set(section, "bind_port", str(port))
+            else:
+                config.remove(section, "bind_address")
+                config.remove(section, "bind_port")
+                config.set(section, "socket", str(socket_directory / socket_file_name))
+        return True
+
+    def _reconfigure_exposure(self, *, is_charm_exposed: bool) -> bool:
+        logger.debug(f"Reconfiguring MySQL Router {is_charm_exposed=}")
+        config = self._container.router_config
+        if not self._configure_exposure(
+            config,
+            is_charm_exposed=is_charm_exposed,
+            socket_directory=self._container.path("/run/mysqlrouter"),
+        ):
+            return False
+        config.save()
+        logger.debug(f"Reconfigured MySQL Router {is_charm_exposed=}")
+        return True
+
     def _bootstrap_router(self, *, event, tls: bool) -> None:
         super()._bootstrap_router(event=event, tls=tls)
         if not self._charm.is_externally_accessible(event=event):
@@ -6,10 +6,20 @@
 https://dev.mysql.com/doc/mysql-shell/8.0/en/
 """
 
+import atexit
+import collections
+import concurrent.futures
+import copy
 import dataclasses
 import json
 import logging
+import os
 import pathlib
+import secrets
+import select
+import subprocess
+import threading
+import time
 import typing
 
 import jinja2
@@ -18,6 +28,8 @@ import container
 import server_exceptions
 import utils
 
+from . import metrics
+
 if typing.TYPE_CHECKING:
     import relations.database_requires
 
@@ -47,6 +59,242 @@ class ShellDBError(Exception):
         self.traceback_message = traceback_message
 
 
+# Prefix for the result line that MySQL Shell writes to stdout
+_RESULT_PREFIX = "mysql-router-charm-result:"
+
+
+class _MissingResult(Exception):
+    """MySQL Shell output did not contain a result line"""
+
+
+def _parse_result(line: str) -> typing.Optional[dict]:
+    """Parse result line written to stdout by MySQL Shell script.
+
+    Returns `None` if line is not a result line
+
+    The prefix may be preceded on the same line by other MySQL Shell output (e.g. the password
+    prompt, which does not end with a newline)
+    """
+    _, separator, result = line.partition(_RESULT_PREFIX)
+    if not separator:
+        return
+    return json.loads(result)
+
+
+class _WorkerUnavailable(Exception):
+    """MySQL Shell worker process failed to start or exited before request was sent"""
+
+
+class WorkerRequestFailed(Exception):
+    """MySQL Shell worker process exited after request was sent
+
+    The request may have been (partially) applied—it is not run again
+    """
+
+
+class _Worker:
+    """Long-lived MySQL Shell process connected to MySQL cluster
+
+    Holds one authenticated session for the lifetime of the charm process (i.e. the current Juju
+    hook). Each request is a JSON line on stdin with Python code to run or SQL statements to
+    execute; each response is a result line on stdout with the script output and the serialized
+    `mysqlsh.DBError`, if raised.
+    """
+
+    # Seconds to wait for the worker process to connect to MySQL
+    # (Requests are not limited—like a MySQL Shell process started for one call)
+    _STARTUP_TIMEOUT = 60
+
+    def __init__(
+        self,
+        *,
+        container_: container.Container,
+        connection_info: "relations.database_requires.CompleteConnectionInformation",
+    ) -> None:
+        """Start worker process and wait until it is connected to MySQL.
+
+        Raises:
+            _WorkerUnavailable: Worker process exited or did not connect before timeout
+        """
+        self._script_file = container_.path(f"/tmp/mysqlsh_worker_{secrets.token_hex(8)}.py")
+        self._script_file.write_text(
+            _jinja_env.get_template("worker.py.jinja").render(result_prefix=_RESULT_PREFIX)
+        )
+        logger.debug("Starting MySQL Shell worker process")
+        # https://bugs.mysql.com/bug.php?id=117429 details on why --no-wizard is omitted
+        self._process = container_.start_mysql_shell([
+            "--passwords-from-stdin",
+            "--uri",
+            f"{connection_info.username}@{connection_info.host}:{connection_info.port}",
+            "--python",
+            "--file",
+            str(self._script_file.relative_to_container),
+        ])
+        # Output read from stdout that does not end with a newline yet
+        self._stdout_buffer = b""
+        # Last lines written to stderr (read in the background so that the pipe does not fill up)
+        self._stderr_lines = collections.deque(maxlen=100)
+        self._stderr_thread = threading.Thread(target=self._read_stderr, daemon=True)
+        self._stderr_thread.start()
+        try:
+            # Consumed by `--passwords-from-stdin` before the script reads requests
+            self._process.stdin.write(connection_info.password + "\n")
+            self._process.stdin.flush()
+            # Written by the script once it is connected to MySQL
+            deadline = time.monotonic() + self._STARTUP_TIMEOUT
+            while _parse_result(self._read_line(timeout=max(deadline - time.monotonic(), 0))) != {
+                "ready": True
+            }:
+                pass
+        except (BrokenPipeError, EOFError, TimeoutError):
+            self.close()
+            logger.warning(
+                "MySQL Shell worker process failed to start. Falling back to one MySQL Shell process "
+                f"per call\nstderr:\n{self.stderr}\n"
+            )
+            raise _WorkerUnavailable
+        logger.debug("Started MySQL Shell worker process")
+
+    @property
+    def stderr(self) -> str:
+        """Last lines written to stderr by worker process"""
+        return "".join(self._stderr_lines)
+
+    def _read_stderr(self) -> None:
+        for line in self._process.stderr:
+            self._stderr_lines.append(line)
+
+    def run(self, request: dict) -> dict:
+        """Run Python code (`{"code": ...}`) or execute SQL (`{"sql": [...]}`) in worker process.
+
+        Waits for the result without timeout
+
+        Returns:
+            Result with script output and serialized `mysqlsh.DBError`, if raised
+
+        Raises:
+            _WorkerUnavailable: Worker process exited before request was sent
+            WorkerRequestFailed: Worker process exited after request was sent
+        """
+        if self._process.poll() is not None:
+            raise _WorkerUnavailable
+        try:
+            self._process.stdin.write(json.dumps(request) + "\n")
+            self._process.stdin.flush()
+        except (BrokenPipeError, ValueError):
+            raise _WorkerUnavailable
+        while True:
+            try:
+                line = self._read_line()
+            except EOFError:
+                raise WorkerRequestFailed("MySQL Shell worker process exited")
+            if (result := _parse_result(line)) is not None:
+                return result
+            logger.debug(f"Ignoring MySQL Shell worker process output {line=}")
+
+    # TODO python3.10 min version: Use `float | None` instead of `typing.Optional[float]`
+    def _read_line(self, *, timeout: typing.Optional[float] = None) -> str:
+        """Read line from worker process stdout.
+
+        Reads from the pipe file descriptor instead of `self._process.stdout`. (`select` only
+        checks the pipe—lines already read into the buffer of `self._process.stdout` would not be
+        returned until the next output from the worker process.)
+
+        Raises:
+            EOFError: Worker process exited
+            TimeoutError: Worker process did not write a line before timeout
+        """
+        while b"\n" not in self._stdout_buffer:
+            ready, _, _ = select.select([self._process.stdout], [], [], timeout)
+            if not ready:
+                raise TimeoutError
+            data = os.read(self._process.stdout.fileno(), 65536)
+            if not data:
+                raise EOFError
+            self._stdout_buffer += data
+        line, _, self._stdout_buffer = self._stdout_buffer.partition(b"\n")
+        return line.decode("utf-8", errors="replace")
+
+    def close(self) -> None:
+        """Stop worker process."""
+        logger.debug("Stopping MySQL Shell worker process")
+        try:
+            self._process.stdin.close()
+        except OSError:
+            pass
+        try:
+            self._process.wait(timeout=5)
+        except subprocess.TimeoutExpired:
+            self._process.kill()
+            self._process.wait()
+        self._stderr_thread.join(timeout=5)
+        self._script_file.unlink(missing_ok=True)
+        logger.debug("Stopped MySQL Shell worker process")
+
+
+# Worker processes started during the current Juju hook
+# (`None` if the worker process failed—do not restart it during the current hook)
+_workers: typing.Dict[tuple, typing.Optional[_Worker]] = {}
+
+
+@atexit.register
+def _close_workers() -> None:
+    for worker in _workers.values():
+        if worker:
+            worker.close()
+    _workers.clear()
+
+
+# Output of read-only MySQL Shell scripts run during the current Juju hook
+# Keyed by connection & script. Entries for a connection are cleared by any other script run on
+# that connection (any script that is not read-only could modify the output).
+_read_only_outputs: typing.Dict[typing.Tuple[tuple, str], typing.Any] = {}
+
+# Serializes MySQL Shell calls from the main thread & background thread
+# (One MySQL Shell worker process per connection runs one request at a time. Memoized output must
+# not be stored after it was cleared by a concurrent call.)
+_lock = threading.RLock()
+
+# Runs read-only MySQL Shell calls in the background while the charm does other work
+# (Threads are joined before `_close_workers` is called at exit)
+_background_executor = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="mysql-shell"
+)
+
+
+def _record_call(
+    *,
+    operation: str,
+    start: float,
+    result: typing.Optional[dict],
+    includes_startup: bool,
+    exit_code: int = None,
+) -> None:
+    """Record metrics for MySQL Shell call.
+
+    Not a `Shell` method—charm tracing wraps every `Shell` method in a span. Metrics are recorded
+    on the span of the `Shell` method that called MySQL Shell (not on a span for this function).
+
+    Args:
+        operation: Name of `Shell` method
+        start: `time.monotonic()` before call
+        result: Result written by MySQL Shell script, if any
+        includes_startup: Whether the call started a MySQL Shell process & connected to MySQL
+            (or waited for the MySQL Shell worker process to connect)
+        exit_code: MySQL Shell process exit code, if a new process was started
+    """
+    call = metrics.Call(
+        operation=operation, duration_seconds=time.monotonic() - start, exit_code=exit_code
+    )
+    if result:
+        call.execution_seconds = result["execution_seconds"]
+        if includes_startup:
+            call.startup_seconds = call.duration_seconds - call.execution_seconds
+        if result["error"]:
+            call.mysql_error_code = result["error"]["code"]
+    metrics.record(call)
+
+
 # TODO python3.10 min version: Add `(kw_only=True)`
 @dataclasses.dataclass
 class Shell:
@@ -59,19 +307,69 @@ class Shell:
     def username(self):
         return self._connection_info.username
 
-    def _run_code(self, code: str) -> None:
-        """Connect to MySQL cluster and run Python code."""
+    @property
+    def _connection_key(self) -> tuple:
+        """Identifies the MySQL Shell worker process for this connection"""
+        return (
+            self._connection_info.username,
+            self._connection_info.password,
+            self._connection_info.host,
+            self._connection_info.port,
+        )
+
+    def _get_worker(self) -> typing.Optional["_Worker"]:
+        """Get (or start) MySQL Shell worker process for this connection.
+
+        Returns `None` if the worker process previously failed during the current Juju hook
+        """
+        key = self._connection_key
+        if key not in _workers:
+            try:
+                _workers[key] = _Worker(
+                    container_=self._container, connection_info=self._connection_info
+                )
+            except OSError:
+                logger.exception("Failed to start MySQL Shell worker process")
+                _workers[key] = None
+            except _WorkerUnavailable:
+                _workers[key] = None
+        return _workers[key]
+
+    def _get_output(self, result: dict, *, script: str):
+        """Get script output or raise de-serialized `mysqlsh.DBError`, if any."""
+        try:
+            if exception := result["error"]:
+                raise ShellDBError(**exception)
+        except ShellDBError as e:
+            if e.code == 2003:
+                logger.exception(server_exceptions.ConnectionError_.MESSAGE)
+                raise server_exceptions.ConnectionError_
+            else:
+                logger.exception(
+                    f"Failed to run MySQL Shell script:\n{script}\n\nMySQL client error {e.code}\nMySQL Shell traceback:\n{e.traceback_message}\n"
+                )
+                raise
+        return result["output"]
+
+    def _run_code_in_new_process(self, code: str, *, operation: str):
+        """Start MySQL Shell process, connect to MySQL cluster, and run Python code.
+
+        Returns:
+            Value of `output` variable set by code
+        """
         template = _jinja_env.get_template("try_except_wrapper.py.jinja")
-        error_file = self._container.path("/tmp/mysqlsh_error.json")
 
-        script = template.render(code=code, error_filepath=error_file.relative_to_container)
+        script = template.render(code=code, result_prefix=_RESULT_PREFIX)
 
-        temporary_script_file = self._container.path("/tmp/mysqlsh_script.py")
+        temporary_script_file = self._container.path(
+            f"/tmp/mysqlsh_script_{secrets.token_hex(8)}.py"
+        )
         temporary_script_file.write_text(script)
 
+        start = time.monotonic()
         try:
             # https://bugs.mysql.com/bug.php?id=117429 details on why --no-wizard is omitted
-            self._container.run_mysql_shell(
+            stdout = self._container.run_mysql_shell(
                 [
                     "--passwords-from-stdin",
                     "--uri",
@@ -83,6 +381,13 @@ class Shell:
                 input=self._connection_info.password,
             )
         except container.CalledProcessError as e:
+            _record_call(
+                operation=operation,
+                start=start,
+                result=None,
+                includes_startup=True,
+                exit_code=e.returncode,
+            )
             logger.exception(
                 f"Failed to run MySQL Shell script:\n{script}\n\nstderr:\n{e.stderr}\n"
             )
@@ -90,29 +395,116 @@ class Shell:
         finally:
             temporary_script_file.unlink()
 
-        with error_file.open("r") as file:
-            exception = json.load(file)
-        error_file.unlink()
+        for line in reversed(stdout.splitlines()):
+            if (result := _parse_result(line)) is not None:
+                break
+        else:
+            result = None
+        _record_call(
+            operation=operation, start=start, result=result, includes_startup=True, exit_code=0
+        )
+        if result is None:
+            logger.error(f"Failed to run MySQL Shell script:\n{script}\n\nstdout:\n{stdout}\n")
+            raise _MissingResult
+        return self._get_output(result, script=script)
+
+    def _run_code(self, code: str, *, operation: str, read_only=False):
+        """Connect to MySQL cluster and run Python code.
+
+        Runs in the MySQL Shell worker process, if available. Otherwise, starts a new MySQL Shell
+        process.
+
+        If `read_only`, the output is memoized until the end of the Juju hook or until code that is
+        not read-only is run on the same connection.
 
+        `operation` (name of `Shell` method) is used for metrics
+
+        Returns:
+            Value of `output` variable set by code
+        """
+        key = (self._connection_key, code)
+        with _lock:
+            if read_only:
+                if key in _read_only_outputs:
+                    logger.debug("Using memoized MySQL Shell output")
+                    return copy.deepcopy(_read_only_outputs[key])
+                output = self._run_code_uncached(code, operation=operation)
+                _read_only_outputs[key] = copy.deepcopy(output)
+                return output
+            self._clear_read_only_outputs()
+            return self._run_code_uncached(code, operation=operation)
+
+    def _clear_read_only_outputs(self) -> None:
+        """Clear memoized output of read-only code run on this connection."""
+        for key in list(_read_only_outputs):
+            if key[0] == self._connection_key:
+                del _read_only_outputs[key]
+
+    def _run_in_worker(self, request: dict, *, script: str, operation: str):
+        """Run request in the MySQL Shell worker process.
+
+        Raises:
+            _WorkerUnavailable: Worker process not available during the current Juju hook (request
+                was not sent—safe to run in a new process)
+            WorkerRequestFailed: Worker process failed after request was sent
+        """
+        includes_startup = self._connection_key not in _workers
+        start = time.monotonic()
+        if not (worker := self._get_worker()):
+            raise _WorkerUnavailable
         try:
-            if exception:
-                raise ShellDBError(**exception)
-        except ShellDBError as e:
-            if e.code == 2003:
-                logger.exception(server_exceptions.ConnectionError_.MESSAGE)
-                raise server_exceptions.ConnectionError_
-            else:
-                logger.exception(
-                    f"Failed to run MySQL Shell script:\n{script}\n\nMySQL client error {e.code}\nMySQL Shell traceback:\n{e.traceback_message}\n"
-                )
-                raise
+            result = worker.run(request)
+        except _WorkerUnavailable:
+            logger.warning(
+                "MySQL Shell worker process unavailable. Falling back to one MySQL Shell process per call"
+            )
+            worker.close()
+            _workers[self._connection_key] = None
+            raise
+        except WorkerRequestFailed:
+            _record_call(
+                operation=operation, start=start, result=None, includes_startup=includes_startup
+            )
+            worker.close()
+            _workers[self._connection_key] = None
+            logger.exception(
+                f"Failed to run MySQL Shell script:\n{script}\n\nstderr:\n{worker.stderr}\n"
+            )
+            raise
+        _record_call(
+            operation=operation, start=start, result=result, includes_startup=includes_startup
+        )
+        return self._get_output(result, script=script)
+
+    def _run_code_uncached(self, code: str, *, operation: str):
+        """Connect to MySQL cluster and run Python code without memoization."""
+        try:
+            return self._run_in_worker({"code": code}, script=code, operation=operation)
+        except _WorkerUnavailable:
+            return self._run_code_in_new_process(code, operation=operation)
 
     # TODO python3.10 min version: Use `list` instead of `typing.List`
-    def _run_sql(self, sql_statements: typing.List[str]) -> None:
-        """Connect to MySQL cluster and execute SQL."""
-        self._run_code(
-            _jinja_env.get_template("run_sql.py.jinja").render(statements=sql_statements)
-        )
+    def _run_sql(self, sql_statements: typing.List[str], *, operation: str) -> None:
+        """Connect to MySQL cluster and execute SQL.
+
+        In the MySQL Shell worker process, SQL statements are executed directly in the existing
+        session (without rendering Python code). Otherwise, starts a new MySQL Shell process.
+
+        `operation` (name of `Shell` method) is used for metrics
+        """
+        with _lock:
+            self._clear_read_only_outputs()
+            try:
+                self._run_in_worker(
+                    {"sql": sql_statements},
+                    script="\n".join(sql_statements),
+                    operation=operation,
+                )
+            except _WorkerUnavailable:
+                self._run_code_in_new_process(
+                    _jinja_env.get_template("run_sql.py.jinja").render(statements=sql_statements),
+                    operation=operation,
+                )
 
     def _get_attributes(self, additional_attributes: dict = None) -> str:
         """Attributes for (MySQL) users created by this charm
@@ -125,19 +517,97 @@ class Shell:
             attributes.update(additional_attributes)
         return json.dumps(attributes)
 
-    def create_application_database_and_user(self, *, username: str, database: str) -> str:
-        """Create database and user for related database_provides application."""
+    # TODO python3.10 min version: Use `list` instead of `typing.List`
+    def _get_create_application_database_and_user_statements(
+        self, *, username: str, database: str, password: str
+    ) -> typing.List[str]:
         attributes = self._get_attributes()
-        logger.debug(f"Creating {database=} and {username=} with {attributes=}")
-        password = utils.generate_password()
-        self._run_sql([
+        return [
             f"CREATE DATABASE IF NOT EXISTS `{database}`",
             f"CREATE USER `{username}` IDENTIFIED BY '{password}' ATTRIBUTE '{attributes}'",
             f"GRANT ALL PRIVILEGES ON `{database}`.* TO `{username}`",
-        ])
-        logger.debug(f"Created {database=} and {username=} with {attributes=}")
+        ]
+
+    def ensure_application_database_and_user(self, *, username: str, database: str) -> str:
+        """Create database and user for related database_provides application.
+
+        If the user already exists, it will be re-created with a new password.
+        (If the user was previously created by this charm—but the hook failed—the user will
+        persist in MySQL but will not persist in the databag. Therefore, we lose the user's
+        password and need to re-create the user.)
+
+        All statements are executed in one MySQL Shell call.
+        """
+        logger.debug(f"Ensuring {database=} and {username=}")
+        password = utils.generate_password()
+        self._run_sql(
+            [
+                f"DROP USER IF EXISTS `{username}`",
+                *self._get_create_application_database_and_user_statements(
+                    username=username, database=database, password=password
+                ),
+            ],
+            operation="ensure_application_database_and_user",
+        )
+        logger.debug(f"Ensured {database=} and {username=}")
         return password
 
+    # TODO python3.10 min version: Use `set` instead of `typing.Set`
+    def get_application_usernames(self) -> typing.Set[str]:
+        """Get all users created by this charm for related applications.
+
+        Excludes MySQL Router users created during bootstrap
+        """
+        logger.debug("Getting application users")
+        rows = self._run_code(
+            _jinja_env.get_template("get_users_created_by_user.py.jinja").render(
+                username=self.username
+            ),
+            operation="get_application_usernames",
+            read_only=True,
+        )
+        usernames = {username for username, router_id in rows if router_id is None}
+        logger.debug(f"Got application users {usernames=}")
+        return usernames
+
+    # TODO python3.10 min version: Use `dict` instead of `typing.Dict`
+    def reconcile_application_users(
+        self,
+        *,
+        users_to_create: typing.Dict[str, str],
+        users_to_delete: typing.Iterable[str],
+    ) -> typing.Dict[str, str]:
+        """Create and delete users for related database_provides applications.
+
+        All statements are executed in one MySQL Shell call.
+
+        Args:
+            users_to_create: Database for each username. If the user already exists, it will be
+                re-created with a new password.
+            users_to_delete: Usernames to delete (if they exist)
+
+        Returns:
+            Password for each created username
+        """
+        users_to_delete = set(users_to_delete)
+        logger.debug(f"Reconciling application users {users_to_create=} {users_to_delete=}")
+        statements = [
+            f"DROP USER IF EXISTS `{username}`"
+            for username in sorted(users_to_delete | users_to_create.keys())
+        ]
+        passwords = {}
+        for username, database in users_to_create.items():
+            passwords[username] = utils.generate_password()
+            statements.extend(
+                self._get_create_application_database_and_user_statements(
+                    username=username, database=database, password=passwords[username]
+                )
+            )
+        if statements:
+            self._run_sql(statements, operation="reconcile_application_users")
+        logger.debug(f"Reconciled application users {users_to_create=} {users_to_delete=}")
+        return passwords
+
     def add_attributes_to_mysql_router_user(
         self, *, username: str, router_id: str, unit_name: str
     ) -> None:
@@ -147,7 +617,10 @@ class Shell:
             "created_by_juju_unit": unit_name,
         })
         logger.debug(f"Adding {attributes=} to {username=}")
-        self._run_sql([f"ALTER USER `{username}` ATTRIBUTE '{attributes}'"])
+        self._run_sql(
+            [f"ALTER USER `{username}` ATTRIBUTE '{attributes}'"],
+            operation="add_attributes_to_mysql_router_user",
+        )
         logger.debug(f"Added {attributes=} to {username=}")
 
     def get_mysql_router_user_for_unit(
@@ -163,17 +636,14 @@ class Shell:
         again.
         """
         logger.debug(f"Getting MySQL Router user for {unit_name=}")
-        output_file = self._container.path("/tmp/mysqlsh_output.json")
-        self._run_code(
+        rows = self._run_code(
             _jinja_env.get_template("get_mysql_router_user_for_unit.py.jinja").render(
                 username=self.username,
                 unit_name=unit_name,
-                output_filepath=output_file.relative_to_container,
-            )
+            ),
+            operation="get_mysql_router_user_for_unit",
+            read_only=True,
         )
-        with output_file.open("r") as file:
-            rows = json.load(file)
-        output_file.unlink()
         if not rows:
             logger.debug(f"No MySQL Router user found for {unit_name=}")
             return
@@ -193,7 +663,8 @@ class Shell:
         self._run_code(
             _jinja_env.get_template("remove_router_from_cluster_metadata.py.jinja").render(
                 router_id=router_id
-            )
+            ),
+            operation="remove_router_from_cluster_metadata",
         )
         logger.debug(f"Removed {router_id=} from cluster metadata")
 
@@ -204,25 +675,53 @@ class Shell:
             statement = f"DROP USER `{username}`"
         else:
             statement = f"DROP USER IF EXISTS `{username}`"
-        self._run_sql([statement])
+        self._run_sql([statement], operation="delete_user")
         logger.debug(f"Deleted {username=} {must_exist=}")
 
-    def is_router_in_cluster_set(self, router_id: str) -> bool:
-        """Check if MySQL Router is part of InnoDB ClusterSet."""
-        logger.debug(f"Checking if {router_id=} in cluster set")
-        output_file = self._container.path("/tmp/mysqlsh_output.json")
-        self._run_code(
-            _jinja_env.get_template("get_routers_in_cluster_set.py.jinja").render(
-                output_filepath=output_file.relative_to_container
-            )
+    # TODO python3.10 min version: Use `list` instead of `typing.List`
+    def get_router_ids_in_cluster_set(self) -> typing.List[str]:
+        """Get IDs of MySQL Routers that are part of InnoDB ClusterSet."""
+        logger.debug("Getting router IDs in cluster set")
+        output = self._run_code(
+            _jinja_env.get_template("get_routers_in_cluster_set.py.jinja").render(),
+            operation="get_router_ids_in_cluster_set",
+            read_only=True,
         )
-        with output_file.open("r") as file:
-            output = json.load(file)
-        output_file.unlink()
-        cluster_set_router_ids = output["routers"].keys()
-        logger.debug(f"{cluster_set_router_ids=}")
-        logger.debug(f"Checked if {router_id in cluster_set_router_ids=}")
-        return router_id in cluster_set_router_ids
+        cluster_set_router_ids = list(output["routers"])
+        logger.debug(f"Got router IDs in cluster set {cluster_set_router_ids=}")
+        return cluster_set_router_ids
+
+    def prefetch_router_ids_in_cluster_set(self) -> None:
+        """Start getting IDs of MySQL Routers in InnoDB ClusterSet in the background.
+
+        The output is memoized. `get_router_ids_in_cluster_set` waits for the background call
+        instead of running the query again (unless other code was run on the same connection
+        after the background call).
+        """
+        logger.debug("Prefetching router IDs in cluster set")
+        _background_executor.submit(self._prefetch_router_ids_in_cluster_set)
+
+    def _prefetch_router_ids_in_cluster_set(self) -> None:
+        try:
+            self.get_router_ids_in_cluster_set()
+        except Exception:
+            # Error will be raised again (from main thread) if output is needed
+            logger.debug("Failed to prefetch router IDs in cluster set", exc_info=True)
+
+
+def _get_bytecode_cache() -> typing.Optional[jinja2.BytecodeCache]:
+    """Cache for compiled templates in charm directory
+
+    Templates are compiled once per charm revision instead of once per Juju hook. (Cached bytecode
+    is not used if the template source changes.)
+    """
+    directory = pathlib.Path(__file__).parent / ".template_bytecode_cache"
+    try:
+        directory.mkdir(exist_ok=True)
+    except OSError:
+        logger.warning("Unable to create template bytecode cache directory")
+        return
+    return jinja2.FileSystemBytecodeCache(str(directory))
 
 
 _jinja_env = jinja2.Environment(
@@ -230,4 +729,8 @@ _jinja_env = jinja2.Environment(
     trim_blocks=True,
     loader=jinja2.FileSystemLoader(pathlib.Path(__file__).parent / "templates"),
     undefined=jinja2.StrictUndefined,
+    # Templates do not change while the charm is running—skip check for modified template source
+    # on each render
+    auto_reload=False,
+    bytecode_cache=_get_bytecode_cache(),
 )
@@ -0,0 +1,165 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""Latency & count metrics for MySQL Shell calls
+
+Each call is recorded as attributes of the current trace span (if charm tracing is enabled) and
+accumulated in a Prometheus text file for the unit.
+
+The text file is written in the node exporter textfile collector format. It is not scraped via
+the COS agent relation—it is only written & collected if node exporter (with the default textfile
+collector directory) runs on the machine.
+"""
+
+import atexit
+import dataclasses
+import logging
+import os
+import pathlib
+import re
+import tempfile
+import typing
+
+from charms.tempo_coordinator_k8s.v0.charm_tracing import get_current_span
+
+logger = logging.getLogger(__name__)
+
+# Node exporter textfile collector directory
+_PROMETHEUS_DIRECTORY = pathlib.Path("/var/lib/prometheus/node-exporter")
+_PREFIX = "mysql_router_charm_mysql_shell"
+_SAMPLE = re.compile(r"(?P<name>[a-z_]+)\{(?P<labels>.*)\} (?P<value>\S+)")
+
+
+# TODO python3.10 min version: Add `(kw_only=True)`
+@dataclasses.dataclass
+class Call:
+    """MySQL Shell call"""
+
+    operation: str
+    # Total time of call
+    duration_seconds: float
+    # Time to start MySQL Shell process & connect to MySQL
+    # (`None` if an existing MySQL Shell worker process was used or if MySQL Shell failed)
+    startup_seconds: typing.Optional[float] = None
+    # Time to run script in MySQL Shell (`None` if MySQL Shell failed)
+    execution_seconds: typing.Optional[float] = None
+    # MySQL Shell process exit code (`None` if MySQL Shell worker process was used)
+    exit_code: typing.Optional[int] = None
+    mysql_error_code: typing.Optional[int] = None
+
+
+# Calls during the current Juju hook
+# TODO python3.10 min version: Use `list` instead of `typing.List`
+_calls: typing.List[Call] = []
+
+
+def record(call: Call) -> None:
+    """Record MySQL Shell call."""
+    logger.debug(f"MySQL Shell {call=}")
+    if span := get_current_span():
+        span.set_attributes({
+            f"mysql_shell.{key}": value
+            for key, value in dataclasses.asdict(call).items()
+            if value is not None
+        })
+    _calls.append(call)
+
+
+def _get_prometheus_file(unit_name: str) -> pathlib.Path:
+    """Prometheus text file for unit
+
+    (Multiple subordinate units can be deployed on the same machine.)
+    """
+    return _PROMETHEUS_DIRECTORY / f"{_PREFIX}_{unit_name.replace('/', '_')}.prom"
+
+
+def _format_labels(**labels: str) -> str:
+    return ",".join(f'{key}="{value}"' for key, value in sorted(labels.items()))
+
+
+# TODO python3.10 min version: Use `dict` instead of `typing.Dict`
+def _parse(text: str) -> typing.Dict[typing.Tuple[str, str], float]:
+    """Parse samples (metric name & labels: value) from Prometheus text file."""
+    samples = {}
+    for line in text.splitlines():
+        if match := _SAMPLE.fullmatch(line):
+            samples[match.group("name"), match.group("labels")] = float(match.group("value"))
+    return samples
+
+
+# TODO python3.10 min version: Use `dict` instead of `typing.Dict`
+def _add_calls(
+    samples: typing.Dict[typing.Tuple[str, str], float],
+    # TODO python3.10 min version: Use `list` instead of `typing.List`
+    calls: typing.List[Call],
+    *,
+    unit_name: str,
+) -> None:
+    """Add calls to Prometheus counters."""
+    for call in calls:
+        key = (
+            f"{_PREFIX}_calls_total",
+            _format_labels(
+                unit=unit_name,
+                operation=call.operation,
+                exit_code="" if call.exit_code is None else str(call.exit_code),
+                mysql_error_code=(
+                    "" if call.mysql_error_code is None else str(call.mysql_error_code)
+                ),
+            ),
+        )
+        samples[key] = samples.get(key, 0) + 1
+        for phase, seconds in (
+            ("total", call.duration_seconds),
+            ("startup", call.startup_seconds),
+            ("execution", call.execution_seconds),
+        ):
+            if seconds is None:
+                continue
+            labels = _format_labels(unit=unit_name, operation=call.operation, phase=phase)
+            for suffix, value in (("sum", seconds), ("count", 1)):
+                key = (f"{_PREFIX}_duration_seconds_{suffix}", labels)
+                samples[key] = samples.get(key, 0) + value
+
+
+# TODO python3.10 min version: Use `dict` instead of `typing.Dict`
+def _render(samples: typing.Dict[typing.Tuple[str, str], float]) -> str:
+    """Render samples in Prometheus text format."""
+    lines = []
+    for family, type_, help_ in (
+        (f"{_PREFIX}_calls_total", "counter", "MySQL Shell calls by the MySQL Router charm"),
+        (f"{_PREFIX}_duration_seconds", "summary", "Duration of MySQL Shell calls by phase"),
+    ):
+        lines.extend((f"# HELP {family} {help_}", f"# TYPE {family} {type_}"))
+        lines.extend(
+            f"{name}{{{labels}}} {value}"
+            for (name, labels), value in sorted(samples.items())
+            if name.startswith(family)
+        )
+    return "\n".join(lines) + "\n"
+
+
+@atexit.register
+def _write_prometheus_file() -> None:
+    """Add calls during the current Juju hook to the counters in the Prometheus text file."""
+    if not _calls:
+        return
+    if not _PROMETHEUS_DIRECTORY.is_dir():
+        # Node exporter not installed—do not create its directory
+        _calls.clear()
+        return
+    unit_name = os.environ["JUJU_UNIT_NAME"]
+    prometheus_file = _get_prometheus_file(unit_name)
+    try:
+        samples = _parse(prometheus_file.read_text()) if prometheus_file.exists() else {}
+        _add_calls(samples, _calls, unit_name=unit_name)
+        # Replace file atomically so that the collector does not read a partially written file
+        with tempfile.NamedTemporaryFile(
+            "w", dir=prometheus_file.parent, prefix=".", suffix=".tmp", delete=False
+        ) as file:
+            file.write(_render(samples))
+        os.chmod(file.name, 0o644)
+        os.replace(file.name, prometheus_file)
+    except OSError:
+        logger.warning("Failed to write MySQL Shell metrics", exc_info=True)
+    _calls.clear()
@@ -0,0 +1,146 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""MySQL Router tuning derived from performance profile & machine size"""
+
+import dataclasses
+import logging
+import math
+import os
+import pathlib
+import typing
+
+import server_exceptions
+
+logger = logging.getLogger(__name__)
+
+CONFIG_OPTION = "profile"
+PRODUCTION = "production"
+TESTING = "testing"
+
+# Estimate of MySQL Router memory usage per client connection (including connection to MySQL
+# Server)
+_CONNECTION_MEMORY_BYTES = 256 * 1024
+# Fraction of machine memory used for MySQL Router connections (in production profile)
+# (MySQL Router is a subordinate charm—most of the machine is used by the application)
+_MEMORY_FRACTION = 0.2
+# File descriptors reserved for MySQL Router (e.g. log files, metadata cache connections)
+_RESERVED_FILE_DESCRIPTORS = 256
+# MySQL Router default `max_total_connections`
+# (Not lowered by production profile—existing deployments keep at least the previous limit)
+_DEFAULT_MAX_TOTAL_CONNECTIONS = 512
+
+
+def _get_cpu_count() -> int:
+    """Number of CPUs available, limited by CPU affinity & cgroup CPU quota"""
+    cpu_count = len(os.sched_getaffinity(0))
+    quota = None
+    if (cpu_max := pathlib.Path("/sys/fs/cgroup/cpu.max")).exists():
+        # cgroup v2
+        # Example: "200000 100000" or "max 100000"
+        quota_microseconds, period_microseconds = cpu_max.read_text().split()
+        if quota_microseconds != "max":
+            quota = int(quota_microseconds) / int(period_microseconds)
+    elif (cfs_quota := pathlib.Path("/sys/fs/cgroup/cpu/cpu.cfs_quota_us")).exists():
+        # cgroup v1
+        quota_microseconds = int(cfs_quota.read_text())
+        # -1: no quota
+        if quota_microseconds > 0:
+            period_microseconds = int(
+                pathlib.Path("/sys/fs/cgroup/cpu/cpu.cfs_period_us").read_text()
+            )
+            quota = quota_microseconds / period_microseconds
+    if quota is not None:
+        cpu_count = min(cpu_count, max(1, math.ceil(quota)))
+    return cpu_count
+
+
+# TODO python3.10 min version: Add `(kw_only=True)`
+@dataclasses.dataclass(frozen=True)
+class Resources:
+    """Machine resources available to MySQL Router"""
+
+    cpu_count: int
+    memory_bytes: int
+    max_open_files: int
+
+    # TODO python3.10 min version: Use `int | None` instead of `typing.Optional[int]`
+    @classmethod
+    def from_machine(cls, *, max_open_files: typing.Optional[int]) -> "Resources":
+        """Get resources of this machine
+
+        Args:
+            max_open_files: Open files limit of MySQL Router service (`None` if unlimited)
+        """
+        memory_bytes = None
+        for line in pathlib.Path("/proc/meminfo").read_text().splitlines():
+            key, _, value = line.partition(":")
+            if key == "MemTotal":
+                # Example: "MemTotal:       16284412 kB"
+                memory_bytes = int(value.split()[0]) * 1024
+                break
+        assert memory_bytes is not None
+        if max_open_files is None:
+            max_open_files = 2**20
+        resources = cls(
+            cpu_count=_get_cpu_count(), memory_bytes=memory_bytes, max_open_files=max_open_files
+        )
+        logger.debug(f"Machine {resources=}")
+        return resources
+
+
+# TODO python3.10 min version: Add `(kw_only=True)`
+@dataclasses.dataclass(frozen=True)
+class Tuning:
+    """MySQL Router settings"""
+
+    max_total_connections: int
+    # 0: only limited by `max_total_connections`
+    max_connections_per_route: int
+    connection_pool_max_idle_server_connections: int
+    connection_pool_idle_timeout: int
+    # Seconds for client to complete handshake with MySQL Router
+    client_connect_timeout: int
+    # Seconds for MySQL Router to connect to MySQL Server
+    connect_timeout: int
+    net_buffer_length: int
+    # Threads handling client & MySQL Server connections
+    io_threads: int
+
+
+def get_tuning(profile: str, resources: Resources) -> Tuning:
+    """Get MySQL Router settings for performance profile & machine size."""
+    if profile == TESTING:
+        # Minimal resource usage & tolerant timeouts for slow test environments
+        return Tuning(
+            max_total_connections=128,
+            max_connections_per_route=0,
+            connection_pool_max_idle_server_connections=8,
+            connection_pool_idle_timeout=5,
+            client_connect_timeout=30,
+            connect_timeout=10,
+            net_buffer_length=16384,
+            io_threads=1,
+        )
+    if profile != PRODUCTION:
+        raise server_exceptions.InvalidConfig(
+            f"Invalid {CONFIG_OPTION} config {profile=}. Must be {PRODUCTION!r} or {TESTING!r}"
+        )
+    # Each client connection uses 2 file descriptors (client & MySQL Server connection)
+    file_descriptor_limit = (resources.max_open_files - _RESERVED_FILE_DESCRIPTORS) // 2
+    memory_limit = int(resources.memory_bytes * _MEMORY_FRACTION) // _CONNECTION_MEMORY_BYTES
+    max_total_connections = max(
+        _DEFAULT_MAX_TOTAL_CONNECTIONS, min(file_descriptor_limit, memory_limit)
+    )
+    return Tuning(
+        max_total_connections=max_total_connections,
+        max_connections_per_route=0,
+        connection_pool_max_idle_server_connections=min(
+            max_total_connections // 4, 64 * resources.cpu_count
+        ),
+        connection_pool_idle_timeout=5,
+        client_connect_timeout=9,
+        connect_timeout=5,
+        net_buffer_length=32768 if resources.memory_bytes >= 16 * 1024**3 else 16384,
+        io_threads=resources.cpu_count,
+    )
@@ -4,6 +4,7 @@
 """Relation(s) to one or more application charms"""
 
 import logging
+import re
 import typing
 
 import charms.data_platform_libs.v0.data_interfaces as data_interfaces
@@ -59,7 +60,7 @@ class _Relation:
             return False
         return self._id == other._id
 
-    def _get_username(self, database_requires_username: str) -> str:
+    def get_username(self, database_requires_username: str) -> str:
         """Database username"""
         # Prefix username with username from database requires relation.
         # This ensures a unique username if MySQL Router is deployed in a different Juju model
@@ -104,29 +105,22 @@ class _RelationThatRequestedUser(_Relation):
             f"Set databag {self._id=} {self._database=}, {username=}, {router_read_write_endpoint=}, {router_read_only_endpoint=}"
         )
 
-    def create_database_and_user(
+    @property
+    def database(self) -> str:
+        """Requested database"""
+        return self._database
+
+    def share_database_and_user(
         self,
         *,
+        username: str,
+        password: str,
         router_read_write_endpoints: str,
         router_read_only_endpoints: str,
         exposed_read_write_endpoints: str,
         exposed_read_only_endpoints: str,
-        shell: mysql_shell.Shell,
     ) -> None:
-        """Create database & user and update databag."""
-        username = self._get_username(shell.username)
-        # Delete user if exists
-        # (If the user was previously created by this charm—but the hook failed—the user will
-        # persist in MySQL but will not persist in the databag. Therefore, we lose the user's
-        # password and need to re-create the user.)
-        logger.debug("Deleting user if exists before creating user")
-        shell.delete_user(username, must_exist=False)
-        logger.debug("Deleted user if exists before creating user")
-
-        password = shell.create_application_database_and_user(
-            username=username, database=self._database
-        )
-
+        """Update databag with created database & user."""
         rw_endpoint = (
             exposed_read_write_endpoints
             if self.external_connectivity
@@ -198,14 +192,6 @@ class _RelationWithSharedUser(_Relation):
         self._interface.delete_relation_data(self._id, list(self._local_databag))
         logger.debug(f"Deleted databag {self._id=}")
 
-    def delete_user(self, *, shell: mysql_shell.Shell) -> None:
-        """Delete user and update databag."""
-        self.delete_databag()
-        # Delete user if exists
-        # (If the user was previously deleted by this charm—but the hook failed—the user will be
-        # deleted in MySQL but will persist in the databag.)
-        shell.delete_user(self._get_username(shell.username), must_exist=False)
-
 
 class RelationEndpoint:
     """Relation endpoint for application charm(s)"""
@@ -300,19 +286,54 @@ class RelationEndpoint:
                 _UnsupportedExtraUserRole,
             ):
                 pass
-        logger.debug(f"State of reconcile users {requested_users=}, {self._shared_users=}")
-        for relation in requested_users:
-            if relation not in self._shared_users:
-                relation.create_database_and_user(
-                    router_read_write_endpoints=router_read_write_endpoints,
-                    router_read_only_endpoints=router_read_only_endpoints,
-                    exposed_read_write_endpoints=exposed_read_write_endpoints,
-                    exposed_read_only_endpoints=exposed_read_only_endpoints,
-                    shell=shell,
-                )
-        for relation in self._shared_users:
-            if relation not in requested_users:
-                relation.delete_user(shell=shell)
+        shared_users = self._shared_users
+        logger.debug(f"State of reconcile users {requested_users=}, {shared_users=}")
+        relations_to_create = [
+            relation for relation in requested_users if relation not in shared_users
+        ]
+        relations_to_delete = [
+            relation for relation in shared_users if relation not in requested_users
+        ]
+        if not (relations_to_create or relations_to_delete):
+            logger.debug(f"No users to reconcile {event=}")
+            return
+        # Get all users created by this charm in one query (instead of one query per relation)
+        # Users left behind by relations that no longer exist (e.g. if a hook failed) will also be
+        # deleted
+        existing_usernames = {
+            username
+            for username in shell.get_application_usernames()
+            if re.fullmatch(rf"{re.escape(shell.username)}-[0-9]+", username)
+        }
+        requested_usernames = {
+            relation.get_username(shell.username) for relation in requested_users
+        }
+        users_to_delete = {
+            relation.get_username(shell.username) for relation in relations_to_delete
+        } | (existing_usernames - requested_usernames)
+        for relation in relations_to_delete:
+            relation.delete_databag()
+        # If the user was previously created by this charm—but the hook failed—the user will
+        # persist in MySQL but will not persist in the databag. Therefore, we lose the user's
+        # password and need to re-create the user.
+        # (`shell.reconcile_application_users` re-creates existing users.)
+        passwords = shell.reconcile_application_users(
+            users_to_create={
+                relation.get_username(shell.username): relation.database
+                for relation in relations_to_create
+            },
+            users_to_delete=users_to_delete,
+        )
+        for relation in relations_to_create:
+            username = relation.get_username(shell.username)
+            relation.share_database_and_user(
+                username=username,
+                password=passwords[username],
+                router_read_write_endpoints=router_read_write_endpoints,
+                router_read_only_endpoints=router_read_only_endpoints,
+                exposed_read_write_endpoints=exposed_read_write_endpoints,
+                exposed_read_only_endpoints=exposed_read_only_endpoints,
+            )
         logger.debug(
             f"Reconciled users {event=}, {router_read_write_endpoints=}, {router_read_only_endpoints=}"
         )
@@ -140,15 +140,8 @@ class _RelationThatRequestedUser(_UnitThatNeedsUser):
         shell: mysql_shell.Shell,
     ) -> None:
         """Create database & user and update databag."""
-        # Delete user if exists
-        # (If the user was previously created by this charm—but the hook failed—the user will
-        # persist in MySQL but will not persist in the databag. Therefore, we lose the user's
-        # password and need to re-create the user.)
-        logger.debug("Deleting user if exists before creating user")
-        shell.delete_user(self._username, must_exist=False)
-        logger.debug("Deleted user if exists before creating user")
-
-        password = shell.create_application_database_and_user(
+        # Re-creates user if exists
+        password = shell.ensure_application_database_and_user(
             username=self._username, database=self._database
         )
         self._peer_app_databag[self.peer_databag_password_key] = password
@@ -13,8 +13,11 @@ import typing
 
 import charms.tls_certificates_interface.v2.tls_certificates as tls_certificates
 import ops
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import ec
 
 import relations.secrets
+import server_exceptions
 
 if typing.TYPE_CHECKING:
     import abstract_charm
@@ -39,9 +42,35 @@ _TLS_FIELDS = [
 ]
 
 
-def _generate_private_key() -> str:
+_KEY_ALGORITHM_CONFIG_OPTION = "tls-key-algorithm"
+# ECDSA private key operations are much cheaper than RSA operations—reduces CPU usage of TLS
+# handshakes on MySQL Router
+_ELLIPTIC_CURVES = {
+    "ecdsa-p256": ec.SECP256R1,
+    "ecdsa-p384": ec.SECP384R1,
+}
+
+
+def _check_key_algorithm(algorithm: str) -> None:
+    """Raise `InvalidConfig` if TLS private key algorithm is not supported."""
+    if algorithm != "rsa" and algorithm not in _ELLIPTIC_CURVES:
+        raise server_exceptions.InvalidConfig(
+            f"Invalid {_KEY_ALGORITHM_CONFIG_OPTION} config {algorithm=}. Must be one of "
+            f"{('rsa', *_ELLIPTIC_CURVES)}"
+        )
+
+
+def _generate_private_key(algorithm: str) -> str:
     """Generate TLS private key."""
-    return tls_certificates.generate_private_key().decode("utf-8")
+    _check_key_algorithm(algorithm)
+    if algorithm == "rsa":
+        return tls_certificates.generate_private_key().decode("utf-8")
+    private_key = ec.generate_private_key(_ELLIPTIC_CURVES[algorithm]())
+    return private_key.private_bytes(
+        encoding=serialization.Encoding.PEM,
+        format=serialization.PrivateFormat.TraditionalOpenSSL,
+        encryption_algorithm=serialization.NoEncryption(),
+    ).decode("utf-8")
 
 
 # TODO python3.10 min version: Add `(kw_only=True)`
@@ -69,7 +98,7 @@ class _Relation:
         """The TLS private key"""
         private_key = self._secrets.get_value(relations.secrets.UNIT_SCOPE, _TLS_PRIVATE_KEY)
         if not private_key:
-            private_key = _generate_private_key()
+            private_key = _generate_private_key(self._charm.config[_KEY_ALGORITHM_CONFIG_OPTION])
             self._secrets.set_value(relations.secrets.UNIT_SCOPE, _TLS_PRIVATE_KEY, private_key)
         return private_key
 
@@ -176,6 +205,7 @@ class RelationEndpoint(ops.Object):
         self.framework.observe(
             self._charm.on[self.NAME].relation_broken, self._on_tls_relation_broken
         )
+        self.framework.observe(self._charm.on.config_changed, self._on_config_changed)
 
         self.framework.observe(
             self._interface.on.certificate_available, self._on_certificate_available
@@ -222,6 +252,14 @@ class RelationEndpoint(ops.Object):
             return None
         return self._relation.certificate_authority
 
+    def check_config(self) -> None:
+        """Raise `InvalidConfig` if TLS charm config is invalid.
+
+        Checked on every reconcile (not only when a private key is generated) so that the blocked
+        status is not overwritten until the config is fixed
+        """
+        _check_key_algorithm(self._charm.config[_KEY_ALGORITHM_CONFIG_OPTION])
+
     @staticmethod
     def _parse_tls_key(raw_content: str) -> str:
         """Parse TLS key from plain text or base64 format."""
@@ -239,7 +277,11 @@ class RelationEndpoint(ops.Object):
         if key := event.params.get("internal-key"):
             key = self._parse_tls_key(key)
         else:
-            key = _generate_private_key()
+            try:
+                key = _generate_private_key(self._charm.config[_KEY_ALGORITHM_CONFIG_OPTION])
+            except server_exceptions.InvalidConfig as e:
+                event.fail(e.status.message)
+                return
             event.log("No key provided. Generated new key.")
             logger.debug("No TLS key provided via action. Generated new key.")
         self._secrets.set_value(relations.secrets.UNIT_SCOPE, _TLS_PRIVATE_KEY, key)
@@ -263,7 +305,24 @@ class RelationEndpoint(ops.Object):
 
     def _on_tls_relation_created(self, event) -> None:
         """Request certificate when TLS relation created."""
-        self._relation.request_certificate_creation(event=event)
+        try:
+            self._relation.request_certificate_creation(event=event)
+        except server_exceptions.InvalidConfig as e:
+            # Certificate requested on config-changed after config is fixed
+            # (Status also reported by `reconcile` until config is fixed)
+            self._charm.unit.status = e.status
+
+    def _on_config_changed(self, event) -> None:
+        """Request certificate if not requested when TLS relation was created (invalid config)."""
+        if self._relation is None or self._secrets.get_value(
+            relations.secrets.UNIT_SCOPE, _TLS_REQUESTED_CSR
+        ):
+            return
+        try:
+            self._relation.request_certificate_creation(event=event)
+        except server_exceptions.InvalidConfig:
+            # Reported as unit status by `reconcile` (`check_config`)
+            pass
 
     def _on_tls_relation_broken(self, _) -> None:
         """Delete TLS certificate."""
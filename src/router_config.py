@@ -0,0 +1,205 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+"""MySQL Router configuration file (mysqlrouter.conf)
+
+Generated by MySQL Router bootstrap & modified by the charm
+
+Modifications only rewrite the option lines that changed—the rest of the file (including comments
+& formatting written by MySQL Router) is preserved byte for byte.
+"""
+
+import logging
+import re
+import typing
+
+if typing.TYPE_CHECKING:
+    import container
+
+logger = logging.getLogger(__name__)
+
+DEFAULT = "DEFAULT"
+CONNECTION_POOL = "connection_pool"
+IO = "io"
+# Placeholder section name for all routing sections
+ALL_ROUTES = "routing:*"
+# Placeholder section name for all routing sections to secondaries (created by bootstrap for
+# read-only endpoints)
+ALL_READ_ONLY_ROUTES = "routing:*?role=SECONDARY"
+_METADATA_CACHE_PREFIX = "metadata_cache:"
+_ROUTING_PREFIX = "routing:"
+
+_SECTION = re.compile(r"\s*\[(?P<name>[^\]]+)\]\s*")
+_OPTION = re.compile(r"(?P<key>[^\s=#;][^=]*?)(?P<delimiter>\s*=\s*)(?P<value>.*?)\s*")
+
+
+class RouterConfig:
+    """MySQL Router configuration file
+
+    Read once per Juju event (unless reloaded) & written only if changed
+    """
+
+    def __init__(self, file: "container.Path") -> None:
+        self._file = file
+        # TODO python3.10 min version: Use `list` instead of `typing.List`
+        self._lines: typing.Optional[typing.List[str]] = None
+        self._changed = False
+
+    def reload(self) -> None:
+        """Discard file contents read from disk (e.g. after MySQL Router bootstrap)."""
+        assert not self._changed, "Unsaved changes to MySQL Router config file"
+        self._lines = None
+
+    @property
+    def exists(self) -> bool:
+        """Whether the config file exists (i.e. whether MySQL Router is bootstrapped)"""
+        return self._lines is not None or self._file.exists()
+
+    # TODO python3.10 min version: Use `list` instead of `typing.List`
+    @property
+    def _file_lines(self) -> typing.List[str]:
+        if self._lines is None:
+            self._lines = self._file.read_text().splitlines(keepends=True)
+        return self._lines
+
+    @property
+    def _delimiter(self) -> str:
+        """Delimiter between key & value used by existing options (e.g. "=" or " = ")"""
+        for line in self._file_lines:
+            if match := _OPTION.fullmatch(line.rstrip("\n")):
+                return match.group("delimiter")
+        return "="
+
+    # TODO python3.10 min version: Use `tuple` instead of `typing.Tuple`
+    def _get_section_range(self, section: str) -> typing.Optional[typing.Tuple[int, int]]:
+        """Index of section header line & index after last option line in section"""
+        start = None
+        end = None
+        for index, line in enumerate(self._file_lines):
+            if match := _SECTION.fullmatch(line.rstrip("\n")):
+                if start is not None:
+                    break
+                if match.group("name") == section:
+                    start = index
+                    end = index + 1
+            elif start is not None and _OPTION.fullmatch(line.rstrip("\n")):
+                end = index + 1
+        if start is None:
+            return
+        return start, end
+
+    def _get_option_index(self, section: str, option: str) -> typing.Optional[int]:
+        if not (section_range := self._get_section_range(section)):
+            return
+        start, end = section_range
+        for index in range(start + 1, end):
+            match = _OPTION.fullmatch(self._file_lines[index].rstrip("\n"))
+            if match and match.group("key").lower() == option.lower():
+                return index
+
+    # TODO python3.10 min version: Use `list` instead of `typing.List`
+    @property
+    def sections(self) -> typing.List[str]:
+        """Names of all sections, in file order"""
+        return [
+            match.group("name")
+            for line in self._file_lines
+            if (match := _SECTION.fullmatch(line.rstrip("\n")))
+        ]
+
+    def get(self, section: str, option: str) -> typing.Optional[str]:
+        """Get option value set in section
+
+        Values in the DEFAULT section are not inherited by other sections
+        """
+        if (index := self._get_option_index(section, option)) is None:
+            return
+        return _OPTION.fullmatch(self._file_lines[index].rstrip("\n")).group("value")
+
+    def set(self, section: str, option: str, value: str) -> None:
+        """Set option value in section, creating the section if needed."""
+        if self.get(section, option) == value:
+            return
+        line = f"{option}{self._delimiter}{value}\n"
+        if (index := self._get_option_index(section, option)) is not None:
+            self._file_lines[index] = line
+        elif section_range := self._get_section_range(section):
+            _, end = section_range
+            if not self._file_lines[end - 1].endswith("\n"):
+                self._file_lines[end - 1] += "\n"
+            self._file_lines.insert(end, line)
+        else:
+            if self._file_lines and self._file_lines[-1].strip():
+                self._file_lines.append("\n")
+            self._file_lines.extend((f"[{section}]\n", line))
+        self._changed = True
+
+    def remove(self, section: str, option: str) -> None:
+        """Remove option from section, if set."""
+        if (index := self._get_option_index(section, option)) is None:
+            return
+        del self._file_lines[index]
+        self._changed = True
+
+    # TODO python3.10 min version: Use `dict` instead of `typing.Dict`
+    def update(self, options: typing.Dict[str, typing.Dict[str, typing.Optional[str]]]) -> None:
+        """Set options (section name: {option: value}). Remove options with value `None`.
+
+        Options in section `ALL_ROUTES` or `ALL_READ_ONLY_ROUTES` are set in every matching
+        routing section
+        """
+        for section_name, section_options in options.items():
+            if section_name == ALL_ROUTES:
+                sections = self.routes
+            elif section_name == ALL_READ_ONLY_ROUTES:
+                sections = self.read_only_routes
+            else:
+                sections = [section_name]
+            for section in sections:
+                for option, value in section_options.items():
+                    if value is None:
+                        self.remove(section, option)
+                    else:
+                        self.set(section, option, value)
+
+    def save(self) -> bool:
+        """Write config file, if changed.
+
+        Returns whether config file was written
+        """
+        if not self._changed:
+            return False
+        logger.debug("Writing MySQL Router config file")
+        self._file.write_text("".join(self._file_lines))
+        self._changed = False
+        logger.debug("Wrote MySQL Router config file")
+        return True
+
+    @property
+    def username(self) -> str:
+        """MySQL Router username
+
+        During bootstrap, MySQL Router creates a config file which includes a generated username.
+        """
+        for section in self.sections:
+            if section.startswith(_METADATA_CACHE_PREFIX) and (
+                username := self.get(section, "user")
+            ):
+                return username
+        raise KeyError("MySQL Router username not found in config file")
+
+    # TODO python3.10 min version: Use `list` instead of `typing.List`
+    @property
+    def routes(self) -> typing.List[str]:
+        """Routing section names (e.g. "routing:bootstrap_rw")"""
+        return [section for section in self.sections if section.startswith(_ROUTING_PREFIX)]
+
+    # TODO python3.10 min version: Use `list` instead of `typing.List`
+    @property
+    def read_only_routes(self) -> typing.List[str]:
+        """Routing section names with secondaries as destinations (e.g. "routing:bootstrap_ro")"""
+        return [
+            section
+            for section in self.routes
+            if (self.get(section, "destinations") or "").endswith("role=SECONDARY")
+        ]
@@ -1,15 +1,22 @@
 # Copyright 2023 Canonical Ltd.
 # See LICENSE file for licensing details.
 
-"""MySQL Server unreachable or unhealthy"""
+"""MySQL Server unreachable or unhealthy (or invalid charm config)
+
+Reported as unit status instead of failing the Juju event
+"""
+
+import logging
 
 import ops
 
 import status_exception
 
+logger = logging.getLogger(__name__)
+
 
 class Error(status_exception.StatusException):
-    """MySQL Server unreachable or unhealthy"""
+    """MySQL Server unreachable or unhealthy (or invalid charm config)"""
 
 
 class ConnectionError_(Error):  # noqa: N801 for underscore in name
@@ -23,3 +30,14 @@ class ConnectionError_(Error):  # noqa: N801 for underscore in name
 
     def __init__(self):
         super().__init__(ops.WaitingStatus(self.MESSAGE))
+
+
+class InvalidConfig(Error):
+    """Invalid charm config
+
+    Reported until the config is fixed (the workload is not reconfigured)
+    """
+
+    def __init__(self, message: str):
+        logger.warning(message)
+        super().__init__(ops.BlockedStatus(message))
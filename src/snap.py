@@ -7,6 +7,7 @@ import enum
 import logging
 import pathlib
 import platform
+import re
 import shutil
 import subprocess
 import typing
@@ -172,6 +173,25 @@ class Snap(container.Container):
     def ready(self) -> bool:
         return True
 
+    @property
+    def installed_revision(self) -> str:
+        return _snap.revision
+
+    @property
+    def mysql_router_service_max_open_files(self) -> typing.Optional[int]:
+        # Example: "524288" or "infinity"
+        limit = self._run_command([
+            "systemctl",
+            "show",
+            f"snap.{_SNAP_NAME}.{self._SERVICE_NAME}.service",
+            "--property",
+            "LimitNOFILE",
+            "--value",
+        ]).strip()
+        if limit == "infinity":
+            return None
+        return int(limit)
+
     @property
     def mysql_router_service_enabled(self) -> bool:
         return _snap.services[self._SERVICE_NAME]["active"]
@@ -250,6 +270,27 @@ class Snap(container.Container):
     def upgrade(self, unit: ops.Unit) -> None:
         """Upgrade snap."""
         _refresh(unit=unit, verb=_RefreshVerb.UPGRADE)
+        self._update_revision_in_router_config_file()
+
+    def _update_revision_in_router_config_file(self) -> None:
+        """Replace revision-specific snap data paths in MySQL Router config file.
+
+        MySQL Router bootstrap can write paths that include the snap revision (e.g.
+        `/var/snap/charmed-mysql/64/var/lib/mysqlrouter/keyring`). snapd copies the data directory
+        to the new revision on refresh & eventually removes the old revision's data directory.
+        """
+        if not self.router_config_file.exists():
+            return
+        config_file_text = self.router_config_file.read_text()
+        updated_config_file_text = re.sub(
+            rf"/var/snap/{_SNAP_NAME}/x?[0-9]+/",
+            f"/var/snap/{_SNAP_NAME}/current/",
+            config_file_text,
+        )
+        if updated_config_file_text != config_file_text:
+            self.router_config_file.write_text(updated_config_file_text)
+            self.router_config.reload()
+            logger.debug("Updated snap revision in MySQL Router config file")
 
     # TODO python3.10 min version: Use `list` instead of `typing.List`
     def _run_command(
@@ -274,5 +315,15 @@ class Snap(container.Container):
             )
         return output
 
+    # TODO python3.10 min version: Use `list` instead of `typing.List`
+    def _start_command(self, command: typing.List[str]) -> subprocess.Popen:
+        return subprocess.Popen(
+            command,
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            encoding="utf-8",
+        )
+
     def path(self, *args, **kwargs) -> _Path:
         return _Path(*args, **kwargs)
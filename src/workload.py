@@ -3,12 +3,15 @@
 
 """MySQL Router workload"""
 
-import configparser
+import dataclasses
+import hashlib
+import json
 import logging
 import pathlib
 import re
 import socket
 import string
+import time
 import typing
 
 import ops
@@ -17,6 +20,8 @@ import tenacity
 
 import container
 import mysql_shell
+import performance_profile
+import router_config
 import server_exceptions
 
 if typing.TYPE_CHECKING:
@@ -27,6 +32,16 @@ if typing.TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# https://dev.mysql.com/doc/mysql-router/8.0/en/mysql-router-conf-options.html#option_mysqlrouter_routing_strategy
+_READ_ONLY_ROUTING_STRATEGIES = ("round-robin-with-fallback", "round-robin", "first-available")
+# https://dev.mysql.com/doc/mysql-router/8.0/en/mysql-router-conf-options.html#option_mysqlrouter_backend
+_IO_BACKENDS = ("linux_epoll", "poll")
+# https://dev.mysql.com/doc/mysql-router/8.0/en/mysql-router-conf-options.html#option_mysqlrouter_client_ssl_mode
+_CLIENT_SSL_MODES = ("DISABLED", "PREFERRED", "REQUIRED", "PASSTHROUGH")
+# https://dev.mysql.com/doc/mysql-router/8.0/en/mysql-router-conf-options.html#option_mysqlrouter_server_ssl_mode
+# (VERIFY_CA & VERIFY_IDENTITY not supported—they require a CA for MySQL Server)
+_SERVER_SSL_MODES = ("DISABLED", "PREFERRED", "REQUIRED", "AS_CLIENT")
+
 
 class _NoQuorum(server_exceptions.Error):
     """MySQL Server does not have quorum"""
@@ -37,6 +52,47 @@ class _NoQuorum(server_exceptions.Error):
         super().__init__(ops.WaitingStatus(self.MESSAGE))
 
 
+# TODO python3.10 min version: Use `set` instead of `typing.Set`
+def _count_tcp_connections(proc_net_tcp: str, *, ports: typing.Set[int]) -> int:
+    """Count established TCP connections to local ports
+
+    Args:
+        proc_net_tcp: Contents of `/proc/net/tcp` or `/proc/net/tcp6`
+        ports: Local ports
+    """
+    count = 0
+    # Skip header line
+    for line in proc_net_tcp.splitlines()[1:]:
+        # Example line:
+        # "0: 0100007F:192E 0100007F:D8A2 01 00000000:00000000 00:00000000 00000000 0 0 ..."
+        _, local_address, _, state, *_ = line.split()
+        # State 01: ESTABLISHED
+        if state == "01" and int(local_address.rpartition(":")[2], 16) in ports:
+            count += 1
+    return count
+
+
+# TODO python3.10 min version: Use `set` instead of `typing.Set`
+def _count_unix_socket_connections(proc_net_unix: str, *, paths: typing.Set[str]) -> int:
+    """Count connections accepted on Unix socket files
+
+    Args:
+        proc_net_unix: Contents of `/proc/net/unix`
+        paths: Unix socket file paths
+    """
+    count = 0
+    # Skip header line
+    for line in proc_net_unix.splitlines()[1:]:
+        # Example line:
+        # "000000006002a255: 00000003 00000000 00000000 0001 03 915 /run/mysqlrouter/mysql.sock"
+        # Accepted connections have the path of the listening socket
+        fields = line.split()
+        # State 03: connected
+        if len(fields) == 8 and fields[5] == "03" and fields[7] in paths:
+            count += 1
+    return count
+
+
 class Workload:
     """MySQL Router workload"""
 
@@ -87,14 +143,14 @@ class Workload:
         self._container.upgrade(unit=unit)
         logger.debug("Upgraded MySQL Router")
 
-    @property
-    def _tls_config_file_data(self) -> str:
+    def _get_tls_config_file_data(self, *, client_ssl_mode: str) -> str:
         """Render config file template to string.
 
         Config file enables TLS on MySQL Router.
         """
         template = string.Template(pathlib.Path("templates/tls.cnf").read_text(encoding="utf-8"))
         config_string = template.substitute(
+            client_ssl_mode=client_ssl_mode,
             tls_ssl_key_file=self._tls_key_file,
             tls_ssl_cert_file=self._tls_certificate_file,
         )
@@ -123,14 +179,48 @@ class Workload:
         self.cleanup_monitoring_user()
         logger.debug("Disabled MySQL Router exporter service")
 
-    def _enable_tls(self, *, key: str, certificate: str, certificate_authority: str) -> None:
-        """Enable TLS."""
+    # TODO python3.10 min version: Use `tuple` instead of `typing.Tuple`
+    def _enable_tls(
+        self, *, key: str, certificate: str, certificate_authority: str, client_ssl_mode: str
+    ) -> typing.Tuple[bool, bool]:
+        """Enable TLS.
+
+        Returns:
+            Whether any file read by MySQL Router changed (TLS config, key, or certificate) &
+            whether the certificate authority changed (only read by the exporter)
+        """
         logger.debug("Creating TLS files")
-        self._container.tls_config_file.write_text(self._tls_config_file_data)
-        self._tls_key_file.write_text(key)
-        self._tls_certificate_file.write_text(certificate)
-        self._tls_certificate_authority_file.write_text(certificate_authority)
-        logger.debug("Created TLS files")
+        router_files_changed = False
+        for file, data in (
+            (
+                self._container.tls_config_file,
+                self._get_tls_config_file_data(client_ssl_mode=client_ssl_mode),
+            ),
+            (self._tls_key_file, key),
+            (self._tls_certificate_file, certificate),
+        ):
+            if self._replace_file(file, data):
+                router_files_changed = True
+        certificate_authority_changed = self._replace_file(
+            self._tls_certificate_authority_file, certificate_authority
+        )
+        logger.debug(f"Created TLS files {router_files_changed=} {certificate_authority_changed=}")
+        return router_files_changed, certificate_authority_changed
+
+    def _replace_file(self, file: container.Path, data: str) -> bool:
+        """Atomically replace file contents, if changed.
+
+        MySQL Router & the exporter never read a partially written file—they read either the old or
+        the new file (e.g. key & certificate for client TLS and for the REST API `[http_server]`)
+
+        Returns whether file changed
+        """
+        if file.exists() and file.read_text() == data:
+            return False
+        temporary_file = self._container.router_config_directory / f".{file.name}.tmp"
+        temporary_file.write_text(data)
+        temporary_file.replace(file)
+        return True
 
     def _disable_tls(self) -> None:
         """Disable TLS."""
@@ -149,6 +239,7 @@ class Workload:
         self._container.update_mysql_router_service(enabled=False)
         self._logrotate.disable()
         self._container.router_config_directory.rmtree()
+        self._container.router_config.reload()
         self._container.router_config_directory.mkdir()
         self._router_data_directory.rmtree()
         self._router_data_directory.mkdir()
@@ -296,26 +387,48 @@ class AuthenticatedWorkload(Workload):
                 else:
                     logger.error(f"Bootstrap failed with MySQL client error {code}")
             raise Exception("Failed to bootstrap router") from None
+        self._container.router_config.reload()
         logger.debug(
             f"Bootstrapped router {tls=}, {self._connection_info.host=}, {self._connection_info.port=}"
         )
 
-    @staticmethod
-    def _parse_username_from_config(config_file_text: str) -> str:
-        config = configparser.ConfigParser()
-        config.read_string(config_file_text)
-        return config["metadata_cache:bootstrap"]["user"]
-
     @property
     def _router_username(self) -> str:
         """Read MySQL Router username from config file.
 
         During bootstrap, MySQL Router creates a config file which includes a generated username.
         """
-        return self._parse_username_from_config(self._container.router_config_file.read_text())
+        return self._container.router_config.username
+
+    def _reconcile_exposure(self, *, is_charm_exposed: typing.Optional[bool]) -> bool:
+        """Switch MySQL Router between TCP & Unix sockets, if external exposure changed.
+
+        Disables MySQL Router (so that it is bootstrapped again) if it cannot be reconfigured in
+        place
+
+        Returns whether MySQL Router was reconfigured in place (and needs to be restarted)
+        """
+        socket_file_exists = self._container.path("/run/mysqlrouter/mysql.sock").exists()
+        if is_charm_exposed != socket_file_exists:
+            return False
+        if self._container.mysql_router_service_enabled and self._reconfigure_exposure(
+            is_charm_exposed=is_charm_exposed
+        ):
+            return True
+        self._disable_router()
+        return False
+
+    def _reconfigure_exposure(self, *, is_charm_exposed: bool) -> bool:
+        """Switch bootstrapped MySQL Router between TCP (externally accessible) & Unix sockets.
+
+        Only applies to machine charm
+
+        Returns `False` if MySQL Router needs to be bootstrapped again instead
+        """
+        return False
 
     def _restart(self, *, event, tls: bool) -> None:
-        """Restart MySQL Router to enable or disable TLS."""
+        """Restart MySQL Router to apply config changes (e.g. enable or disable TLS)."""
         logger.debug("Restarting MySQL Router")
         assert self._container.mysql_router_service_enabled is True
         self._container.update_mysql_router_service(enabled=True, tls=tls)
@@ -325,6 +438,128 @@ class AuthenticatedWorkload(Workload):
         # status
         self._charm.set_status(event=None)
 
+    @property
+    def _read_only_routing_strategy(self) -> str:
+        """MySQL Router routing strategy for read-only endpoints"""
+        strategy = self._charm.config["read-only-routing-strategy"]
+        if strategy not in _READ_ONLY_ROUTING_STRATEGIES:
+            raise server_exceptions.InvalidConfig(
+                f"Invalid read-only-routing-strategy config {strategy=}. Must be one of "
+                f"{_READ_ONLY_ROUTING_STRATEGIES}"
+            )
+        return strategy
+
+    @property
+    def _io_backend(self) -> typing.Optional[str]:
+        """MySQL Router I/O event loop backend (`None` for MySQL Router default)"""
+        backend = self._charm.config.get("io-backend")
+        if backend is not None and backend not in _IO_BACKENDS:
+            raise server_exceptions.InvalidConfig(
+                f"Invalid io-backend config {backend=}. Must be one of {_IO_BACKENDS}"
+            )
+        return backend
+
+    @property
+    def _client_ssl_mode(self) -> typing.Optional[str]:
+        """MySQL Router TLS mode for client connections (`None` if not configured)"""
+        mode = self._charm.config.get("client-ssl-mode")
+        if mode is not None and mode not in _CLIENT_SSL_MODES:
+            raise server_exceptions.InvalidConfig(
+                f"Invalid client-ssl-mode config {mode=}. Must be one of {_CLIENT_SSL_MODES}"
+            )
+        return mode
+
+    def _get_default_server_ssl_mode(self, *, is_charm_exposed: typing.Optional[bool]) -> str:
+        """MySQL Router TLS mode for connections to MySQL Server set by bootstrap"""
+        return "AS_CLIENT"
+
+    def _get_server_ssl_mode(self, *, is_charm_exposed: typing.Optional[bool]) -> str:
+        """MySQL Router TLS mode for connections to MySQL Server"""
+        mode = self._charm.config.get("server-ssl-mode")
+        if mode is None:
+            if self._client_ssl_mode == "PASSTHROUGH":
+                return "AS_CLIENT"
+            return self._get_default_server_ssl_mode(is_charm_exposed=is_charm_exposed)
+        if mode not in _SERVER_SSL_MODES:
+            raise server_exceptions.InvalidConfig(
+                f"Invalid server-ssl-mode config {mode=}. Must be one of {_SERVER_SSL_MODES}"
+            )
+        if self._client_ssl_mode == "PASSTHROUGH" and mode != "AS_CLIENT":
+            raise server_exceptions.InvalidConfig(
+                f"Invalid server-ssl-mode config {mode=}. client-ssl-mode PASSTHROUGH requires "
+                "server-ssl-mode AS_CLIENT"
+            )
+        return mode
+
+    # TODO python3.10 min version: Use `dict` instead of `typing.Dict`
+    def _get_router_options(
+        self, *, is_charm_exposed: typing.Optional[bool]
+    ) -> typing.Dict[str, typing.Dict[str, typing.Optional[str]]]:
+        """MySQL Router config options set from charm config (section name: {option: value})
+
+        Derived from the performance profile & machine size unless overridden by charm config
+        """
+        config = self._charm.config
+        tuning = performance_profile.get_tuning(
+            config[performance_profile.CONFIG_OPTION],
+            performance_profile.Resources.from_machine(
+                max_open_files=self._container.mysql_router_service_max_open_files
+            ),
+        )
+
+        def get(config_option: str, default: int) -> str:
+            value = config.get(config_option)
+            return str(default if value is None else value)
+
+        return {
+            router_config.DEFAULT: {
+                "max_total_connections": get(
+                    "max-total-connections", tuning.max_total_connections
+                ),
+                "connect_timeout": str(tuning.connect_timeout),
+                # Overridden by TLS config file if TLS is enabled
+                "client_ssl_mode": self._client_ssl_mode or "PREFERRED",
+                "server_ssl_mode": self._get_server_ssl_mode(is_charm_exposed=is_charm_exposed),
+                "client_ssl_cipher": config.get("tls-client-ciphers"),
+                "client_ssl_curves": config.get("tls-client-curves"),
+            },
+            router_config.ALL_ROUTES: {
+                "max_connections": get(
+                    "max-connections-per-route", tuning.max_connections_per_route
+                ),
+                "client_connect_timeout": str(tuning.client_connect_timeout),
+                "net_buffer_length": str(tuning.net_buffer_length),
+            },
+            router_config.ALL_READ_ONLY_ROUTES: {
+                "routing_strategy": self._read_only_routing_strategy,
+            },
+            router_config.IO: {
+                "threads": get("io-threads", tuning.io_threads),
+                "backend": self._io_backend,
+            },
+            router_config.CONNECTION_POOL: {
+                "max_idle_server_connections": get(
+                    "connection-pool-max-idle-server-connections",
+                    tuning.connection_pool_max_idle_server_connections,
+                ),
+                "idle_timeout": get(
+                    "connection-pool-idle-timeout", tuning.connection_pool_idle_timeout
+                ),
+            },
+        }
+
+    def _update_router_options(self, *, is_charm_exposed: typing.Optional[bool]) -> bool:
+        """Update MySQL Router config options from charm config.
+
+        MySQL Router reads its config file on startup—MySQL Router needs to be restarted if the
+        config file changed.
+
+        Returns whether config file changed
+        """
+        config = self._container.router_config
+        config.update(self._get_router_options(is_charm_exposed=is_charm_exposed))
+        return config.save()
+
     def _enable_router(self, *, event, tls: bool, unit_name: str) -> None:
         """Enable router after setting up all the necessary prerequisites."""
         logger.info("Enabling MySQL Router service")
@@ -332,6 +567,9 @@ class AuthenticatedWorkload(Workload):
         # create an empty credentials file, if the file does not exist
         self._container.create_router_rest_api_credentials_file()
         self._bootstrap_router(event=event, tls=tls)
+        self._update_router_options(
+            is_charm_exposed=self._charm.is_externally_accessible(event=event)
+        )
         self.shell.add_attributes_to_mysql_router_user(
             username=self._router_username, router_id=self._router_id, unit_name=unit_name
         )
@@ -340,6 +578,40 @@ class AuthenticatedWorkload(Workload):
         logger.info("Enabled MySQL Router service")
         self._charm.wait_until_mysql_router_ready(event=event)
 
+    @property
+    def _reconciled_state_file(self) -> container.Path:
+        """Fingerprint of the desired state that was last reconciled
+
+        Deleted (with the rest of the MySQL Router config directory) when MySQL Router is disabled
+        """
+        return self._container.router_config_directory / "charm-reconciled-state"
+
+    def _get_state_fingerprint(
+        self,
+        *,
+        tls: bool,
+        is_charm_exposed: typing.Optional[bool],
+        exporter_config: "relations.cos.ExporterConfig",
+        key: typing.Optional[str],
+        certificate: typing.Optional[str],
+        certificate_authority: typing.Optional[str],
+    ) -> str:
+        """Fingerprint of desired state"""
+        state = {
+            "tls": tls,
+            "key": key,
+            "certificate": certificate,
+            "certificate_authority": certificate_authority,
+            "exporter_config": dataclasses.asdict(exporter_config) if exporter_config else None,
+            "is_charm_exposed": is_charm_exposed,
+            "router_options": self._get_router_options(is_charm_exposed=is_charm_exposed),
+            "host": self._connection_info.host,
+            "port": self._connection_info.port,
+            "revision": self._container.installed_revision,
+        }
+        # Hash state so that secrets (e.g. TLS key) are not written to disk
+        return hashlib.sha256(json.dumps(state, sort_keys=True).encode()).hexdigest()
+
     def _enable_exporter(
         self, *, tls: bool, exporter_config: "relations.cos.ExporterConfig"
     ) -> None:
@@ -373,26 +645,48 @@ class AuthenticatedWorkload(Workload):
                 "`key`, `certificate`, and `certificate_authority` arguments required when tls=True"
             )
 
+        is_charm_exposed = self._charm.is_externally_accessible(event=event)
+        fingerprint = self._get_state_fingerprint(
+            tls=tls,
+            is_charm_exposed=is_charm_exposed,
+            exporter_config=exporter_config,
+            key=key,
+            certificate=certificate,
+            certificate_authority=certificate_authority,
+        )
+        # Skip checking files & updating services if nothing changed since the last reconcile
+        # (Services are still checked—e.g. if MySQL Router crashed or was manually stopped, it
+        # needs to be enabled again)
+        if (
+            self._container.mysql_router_service_enabled
+            and self._container.mysql_router_exporter_service_enabled == bool(exporter_config)
+            and self._reconciled_state_file.exists()
+            and self._reconciled_state_file.read_text() == fingerprint
+        ):
+            logger.debug("Desired state unchanged since last reconcile")
+            return
+
         # If the host or port changes, MySQL Router will receive topology change
         # notifications from MySQL.
         # Therefore, if the host or port changes, we do not need to restart MySQL Router.
-        is_charm_exposed = self._charm.is_externally_accessible(event=event)
-        socket_file_exists = self._container.path("/run/mysqlrouter/mysql.sock").exists()
-        require_rebootstrap = is_charm_exposed == socket_file_exists
-        if require_rebootstrap:
-            self._disable_router()
+        exposure_reconfigured = self._reconcile_exposure(is_charm_exposed=is_charm_exposed)
 
-        # `self._custom_certificate` will change after we enable/disable TLS
-        custom_certificate = self._custom_certificate
+        # MySQL Router does not reload TLS files while running. Only restart if TLS files read by
+        # MySQL Router changed (the certificate authority is only read by the exporter)
         if tls:
-            self._enable_tls(
-                key=key, certificate=certificate, certificate_authority=certificate_authority
+            tls_files_changed, certificate_authority_changed = self._enable_tls(
+                key=key,
+                certificate=certificate,
+                certificate_authority=certificate_authority,
+                client_ssl_mode=self._client_ssl_mode or "REQUIRED",
             )
-            if custom_certificate != certificate and self._container.mysql_router_service_enabled:
-                self._restart(event=event, tls=tls)
         else:
+            tls_files_changed = self._custom_certificate is not None
+            certificate_authority_changed = False
             self._disable_tls()
-            if custom_certificate and self._container.mysql_router_service_enabled:
+        if self._container.mysql_router_service_enabled:
+            router_options_changed = self._update_router_options(is_charm_exposed=is_charm_exposed)
+            if exposure_reconfigured or tls_files_changed or router_options_changed:
                 self._restart(event=event, tls=tls)
 
         if not self._container.mysql_router_service_enabled:
@@ -400,18 +694,30 @@ class AuthenticatedWorkload(Workload):
 
         if (not self._container.mysql_router_exporter_service_enabled and exporter_config) or (
             self._container.mysql_router_exporter_service_enabled
-            and custom_certificate != certificate
+            and (tls_files_changed or certificate_authority_changed)
         ):
             self._enable_exporter(tls=tls, exporter_config=exporter_config)
         elif self._container.mysql_router_exporter_service_enabled and not exporter_config:
             self._disable_exporter()
 
+        self._reconciled_state_file.write_text(fingerprint)
+
+    def prefetch_status(self) -> None:
+        """Start querying MySQL for status in the background.
+
+        Overlaps the query with the rest of the Juju event handling
+        """
+        if self._container.mysql_router_service_enabled:
+            self._charm.cluster_set_routers.prefetch(self._router_id, shell=self.shell)
+
     @property
     def status(self) -> typing.Optional[ops.StatusBase]:
         """Report non-active status."""
         if status := super().status:
             return status
-        if not self.shell.is_router_in_cluster_set(self._router_id):
+        if not self._charm.cluster_set_routers.is_router_in_cluster_set(
+            self._router_id, shell=self.shell
+        ):
             # Router should not be removed from ClusterSet after bootstrap (except by MySQL charm
             # when MySQL Router unit departs relation).
             # If Router is not part of ClusterSet after bootstrap, it most likely was manually
@@ -427,15 +733,98 @@ class AuthenticatedWorkload(Workload):
         exporter_enabled = self._container.mysql_router_exporter_service_enabled
         if exporter_enabled:
             self._disable_exporter()
+        version_before_upgrade = self.version
         if enabled:
-            logger.debug("Disabling MySQL Router service before upgrade")
-            self._disable_router()
+            self._drain_connections()
+            # Keep MySQL Router config, keyring & dynamic state so that MySQL Router does not need
+            # to be bootstrapped again
+            logger.debug("Stopping MySQL Router service before upgrade")
+            self._container.update_mysql_router_service(enabled=False)
         super().upgrade(event=event, unit=unit, tls=tls, exporter_config=exporter_config)
         if enabled:
-            logger.debug("Re-enabling MySQL Router service after upgrade")
-            self._enable_router(event=event, tls=tls, unit_name=unit.name)
+            if self._bootstrap_required_after_upgrade(
+                version_before_upgrade=version_before_upgrade
+            ):
+                logger.debug("Re-bootstrapping MySQL Router after upgrade")
+                self._disable_router()
+                self._enable_router(event=event, tls=tls, unit_name=unit.name)
+            else:
+                logger.debug("Starting MySQL Router service after upgrade")
+                self._container.update_mysql_router_service(enabled=True, tls=tls)
+                self._charm.wait_until_mysql_router_ready(event=event)
         if exporter_enabled:
             self._enable_exporter(tls=tls, exporter_config=exporter_config)
+        # The installed revision cached by the container may not reflect the upgrade until the next
+        # Juju event—make sure the next reconcile is not skipped
+        self._reconciled_state_file.unlink(missing_ok=True)
+
+    def _count_connections(self) -> int:
+        """Count client connections to MySQL Router"""
+        config = self._container.router_config
+        ports = set()
+        socket_files = set()
+        for route in config.routes:
+            if port := config.get(route, "bind_port"):
+                ports.add(int(port))
+            if socket_file := config.get(route, "socket"):
+                socket_files.add(socket_file)
+        count = 0
+        for file_name in ("tcp", "tcp6"):
+            file = pathlib.Path("/proc/net", file_name)
+            if file.exists():
+                count += _count_tcp_connections(file.read_text(), ports=ports)
+        count += _count_unix_socket_connections(
+            pathlib.Path("/proc/net/unix").read_text(), paths=socket_files
+        )
+        return count
+
+    def _drain_connections(self) -> None:
+        """Wait for client connections to close before MySQL Router is stopped.
+
+        New connections to Unix sockets are refused while draining. (MySQL Router cannot stop
+        accepting connections on TCP ports without a restart.)
+        """
+        timeout = self._charm.config["drain-timeout"]
+        if (
+            timeout <= 0
+            or not self._container.mysql_router_service_enabled
+            or not self._container.router_config.exists
+        ):
+            return
+        logger.debug(f"Draining MySQL Router connections {timeout=}")
+        # Remove socket files so that new connections are refused. Existing connections are not
+        # affected. (MySQL Router creates the socket files again on startup.)
+        config = self._container.router_config
+        for route in config.routes:
+            if socket_file := config.get(route, "socket"):
+                self._container.path(socket_file).unlink(missing_ok=True)
+        deadline = time.monotonic() + timeout
+        while (count := self._count_connections()) and time.monotonic() < deadline:
+            self._charm.unit.status = ops.MaintenanceStatus(
+                f"Draining {count} MySQL Router connection{'' if count == 1 else 's'}"
+            )
+            time.sleep(1)
+        if count:
+            logger.warning(
+                f"Stopping MySQL Router with {count} active connections after {timeout=}"
+            )
+        else:
+            logger.debug("Drained MySQL Router connections")
+
+    def _disable_router(self) -> None:
+        self._drain_connections()
+        super()._disable_router()
+
+    def _bootstrap_required_after_upgrade(self, *, version_before_upgrade: str) -> bool:
+        """Whether MySQL Router config from before upgrade cannot be used after upgrade
+
+        MySQL Router config & InnoDB Cluster metadata are compatible across patch versions
+        """
+        if not self._container.router_config.exists:
+            return True
+        version = self.version
+        logger.debug(f"MySQL Router {version_before_upgrade=} {version=}")
+        return version_before_upgrade.split(".")[:2] != version.split(".")[:2]
 
     def _wait_until_http_server_authenticates(self) -> None:
         """Wait until active connection with router HTTP server using monitoring credentials."""
@@ -446,7 +835,9 @@ class AuthenticatedWorkload(Workload):
                 | tenacity.retry_if_exception_type(requests.exceptions.HTTPError),
                 reraise=True,
                 stop=tenacity.stop_after_delay(30),
-                wait=tenacity.wait_fixed(5),
+                # MySQL Router is usually ready in less than a second. Retry quickly at first
+                # (0.05s, 0.1s, 0.2s, ...)
+                wait=tenacity.wait_exponential(multiplier=0.05, max=2),
             ):
                 with attempt:
                     response = requests.get(
@@ -37,10 +37,17 @@ def patch(monkeypatch):
     )
     monkeypatch.setattr("workload.AuthenticatedWorkload._router_username", "")
     monkeypatch.setattr("mysql_shell.Shell._run_code", lambda *args, **kwargs: None)
+    monkeypatch.setattr("mysql_shell.Shell._run_sql", lambda *args, **kwargs: None)
     monkeypatch.setattr(
         "mysql_shell.Shell.get_mysql_router_user_for_unit", lambda *args, **kwargs: None
     )
-    monkeypatch.setattr("mysql_shell.Shell.is_router_in_cluster_set", lambda *args, **kwargs: True)
+    monkeypatch.setattr(
+        "cluster_set_routers.Cache.is_router_in_cluster_set", lambda *args, **kwargs: True
+    )
+    monkeypatch.setattr("cluster_set_routers.Cache.prefetch", lambda *args, **kwargs: None)
+    monkeypatch.setattr(
+        "mysql_shell.Shell.get_application_usernames", lambda *args, **kwargs: set()
+    )
     monkeypatch.setattr("upgrade.Upgrade.in_progress", False)
     monkeypatch.setattr("upgrade.Upgrade.versions_set", True)
     monkeypatch.setattr("upgrade.Upgrade.is_compatible", True)
@@ -53,6 +60,7 @@ def machine_patch(monkeypatch):
 
     class Snap:
         present = False
+        revision = "1"
 
         def __init__(self):
             self.services = {
@@ -102,8 +110,10 @@ def machine_patch(monkeypatch):
         "snap.Snap._run_command",
         lambda *args, **kwargs: "null",  # Use "null" for `json.loads()`
     )
+    monkeypatch.setattr("snap.Snap.mysql_router_service_max_open_files", 524288)
     monkeypatch.setattr("snap._Path.read_text", lambda *args, **kwargs: "")
     monkeypatch.setattr("snap._Path.write_text", lambda *args, **kwargs: None)
+    monkeypatch.setattr("snap._Path.replace", lambda *args, **kwargs: None)
     monkeypatch.setattr("snap._Path.unlink", lambda *args, **kwargs: None)
     monkeypatch.setattr("snap._Path.mkdir", lambda *args, **kwargs: None)
     monkeypatch.setattr("snap._Path.rmtree", lambda *args, **kwargs: None)
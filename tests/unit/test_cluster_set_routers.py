@@ -0,0 +1,75 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import unittest.mock
+
+import ops
+import ops.testing
+import pytest
+
+import cluster_set_routers
+
+_METADATA = """
+name: test
+"""
+_CONFIG = """
+options:
+  cluster-status-cache-ttl:
+    type: int
+    default: 600
+"""
+
+
+# Patched for charm tests in conftest.py
+_IS_ROUTER_IN_CLUSTER_SET = cluster_set_routers.Cache.is_router_in_cluster_set
+
+
+class _Charm(ops.CharmBase):
+    def __init__(self, *args) -> None:
+        super().__init__(*args)
+        self.cluster_set_routers = cluster_set_routers.Cache(self)
+
+
+@pytest.fixture
+def harness(monkeypatch):
+    monkeypatch.setattr(
+        cluster_set_routers.Cache, "is_router_in_cluster_set", _IS_ROUTER_IN_CLUSTER_SET
+    )
+    monkeypatch.setattr("time.time", lambda: 1000)
+    harness = ops.testing.Harness(_Charm, meta=_METADATA, config=_CONFIG)
+    harness.begin()
+    yield harness
+    harness.cleanup()
+
+
+def _is_router_in_cluster_set(harness, router_id: str, *, router_ids: list) -> tuple:
+    """Returns result & whether cluster metadata was queried"""
+    shell = unittest.mock.Mock()
+    shell.get_router_ids_in_cluster_set.return_value = router_ids
+    result = harness.charm.cluster_set_routers.is_router_in_cluster_set(router_id, shell=shell)
+    return result, shell.get_router_ids_in_cluster_set.called
+
+
+def test_ttl(harness, monkeypatch):
+    assert _is_router_in_cluster_set(harness, "a", router_ids=["a"]) == (True, True)
+    monkeypatch.setattr("time.time", lambda: 1600)
+    assert _is_router_in_cluster_set(harness, "a", router_ids=["a"]) == (True, False)
+    monkeypatch.setattr("time.time", lambda: 1601)
+    assert _is_router_in_cluster_set(harness, "a", router_ids=[]) == (False, True)
+
+
+def test_router_not_found_not_cached(harness):
+    assert _is_router_in_cluster_set(harness, "a", router_ids=["b"]) == (False, True)
+    assert _is_router_in_cluster_set(harness, "a", router_ids=["b"]) == (False, True)
+
+
+def test_other_router_id_not_cached(harness):
+    assert _is_router_in_cluster_set(harness, "a", router_ids=["a"]) == (True, True)
+    # e.g. MySQL Router bootstrapped again with different router ID
+    assert _is_router_in_cluster_set(harness, "b", router_ids=["a"]) == (False, True)
+
+
+def test_cache_disabled(harness):
+    harness.update_config({"cluster-status-cache-ttl": 0})
+    assert _is_router_in_cluster_set(harness, "a", router_ids=["a"]) == (True, True)
+    assert _is_router_in_cluster_set(harness, "a", router_ids=["a"]) == (True, True)
@@ -0,0 +1,138 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import types
+
+import relations.database_provides as database_provides
+
+_ENDPOINTS = {
+    "router_read_write_endpoints": "file:///run/mysql.sock",
+    "router_read_only_endpoints": "file:///run/mysqlro.sock",
+    "exposed_read_write_endpoints": "10.0.0.1:6446",
+    "exposed_read_only_endpoints": "10.0.0.1:6447",
+}
+_SHARED_DATABAG = {
+    "database": "myapp",
+    "username": "shared",
+    "password": "shared",
+    "endpoints": "file:///run/mysql.sock",
+    "read-only-endpoints": "file:///run/mysqlro.sock",
+}
+
+
+class _Interface:
+    """Fake `DatabaseProvides` interface"""
+
+    def __init__(self, *, remote_databags: dict, local_databags: dict) -> None:
+        self.relations = [
+            types.SimpleNamespace(id=id_, name="database", app=types.SimpleNamespace(name="app"))
+            for id_ in sorted(remote_databags.keys() | local_databags.keys())
+        ]
+        self._remote_databags = remote_databags
+        self.local_databags = {
+            relation.id: dict(local_databags.get(relation.id, {})) for relation in self.relations
+        }
+
+    def fetch_relation_data(self):
+        return {id_: self._remote_databags.get(id_, {}) for id_ in self.local_databags}
+
+    def fetch_my_relation_data(self, ids):
+        return {id_: self.local_databags[id_] for id_ in ids}
+
+    def delete_relation_data(self, id_, keys):
+        for key in keys:
+            self.local_databags[id_].pop(key)
+
+    def set_database(self, id_, database):
+        self.local_databags[id_]["database"] = database
+
+    def set_credentials(self, id_, username, password):
+        self.local_databags[id_].update(username=username, password=password)
+
+    def set_endpoints(self, id_, endpoints):
+        self.local_databags[id_]["endpoints"] = endpoints
+
+    def set_read_only_endpoints(self, id_, endpoints):
+        self.local_databags[id_]["read-only-endpoints"] = endpoints
+
+
+class _Shell:
+    """Fake `mysql_shell.Shell`"""
+
+    username = "relation-1"
+
+    def __init__(self, application_usernames: set) -> None:
+        self._application_usernames = application_usernames
+        self.calls = []
+
+    def get_application_usernames(self):
+        return self._application_usernames
+
+    def reconcile_application_users(self, *, users_to_create, users_to_delete):
+        self.calls.append((users_to_create, set(users_to_delete)))
+        return {username: "password" for username in users_to_create}
+
+
+def _reconcile_users(*, interface: _Interface, shell: _Shell) -> None:
+    endpoint = database_provides.RelationEndpoint.__new__(database_provides.RelationEndpoint)
+    endpoint._interface = interface
+    endpoint.reconcile_users(event=None, shell=shell, **_ENDPOINTS)
+
+
+def test_create_user():
+    interface = _Interface(remote_databags={2: {"database": "myapp"}}, local_databags={})
+    shell = _Shell(set())
+    _reconcile_users(interface=interface, shell=shell)
+    assert shell.calls == [({"relation-1-2": "myapp"}, set())]
+    assert interface.local_databags[2] == {
+        "database": "myapp",
+        "username": "relation-1-2",
+        "password": "password",
+        "endpoints": "file:///run/mysql.sock",
+        "read-only-endpoints": "file:///run/mysqlro.sock",
+    }
+
+
+def test_delete_user():
+    # Relation 3 no longer requests a user (e.g. incomplete remote databag)
+    interface = _Interface(
+        remote_databags={2: {"database": "myapp"}},
+        local_databags={2: _SHARED_DATABAG, 3: _SHARED_DATABAG},
+    )
+    shell = _Shell({"relation-1-2", "relation-1-3"})
+    _reconcile_users(interface=interface, shell=shell)
+    assert shell.calls == [({}, {"relation-1-3"})]
+    assert interface.local_databags == {2: _SHARED_DATABAG, 3: {}}
+
+
+def test_delete_orphaned_users():
+    # Users created by relations that no longer exist (e.g. if a hook failed)
+    interface = _Interface(remote_databags={2: {"database": "myapp"}}, local_databags={})
+    shell = _Shell({"relation-1-7", "relation-1-8"})
+    _reconcile_users(interface=interface, shell=shell)
+    assert shell.calls == [({"relation-1-2": "myapp"}, {"relation-1-7", "relation-1-8"})]
+
+
+def test_keep_users_not_created_by_database_provides():
+    # e.g. users created for shared-db relations or by another router application
+    interface = _Interface(remote_databags={2: {"database": "myapp"}}, local_databags={})
+    shell = _Shell({
+        "keystone",
+        "relation-1-2a",
+        "relation-1-admin",
+        "relation-10-3",
+        "relation-1",
+    })
+    _reconcile_users(interface=interface, shell=shell)
+    assert shell.calls == [({"relation-1-2": "myapp"}, set())]
+
+
+def test_no_changes():
+    # Users are not queried or modified if all requested users are shared
+    interface = _Interface(
+        remote_databags={2: {"database": "myapp"}}, local_databags={2: _SHARED_DATABAG}
+    )
+    shell = _Shell({"relation-1-2", "relation-1-7"})
+    _reconcile_users(interface=interface, shell=shell)
+    assert shell.calls == []
+    assert interface.local_databags == {2: _SHARED_DATABAG}
@@ -0,0 +1,102 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import configparser
+import pathlib
+import typing
+
+import pytest
+
+import machine_workload
+import router_config
+
+_SOCKETS_CONFIG = """[DEFAULT]
+name = system
+server_ssl_mode = PREFERRED
+
+[metadata_cache:bootstrap]
+user = mysql_router1_hc3hpayqp2by
+
+[routing:bootstrap_rw]
+socket = /var/snap/charmed-mysql/common/run/mysqlrouter/mysql.sock
+destinations = metadata-cache://cluster-set-35f57988bc107ceafce1854a03664d6b/?role=PRIMARY
+routing_strategy = first-available
+protocol = classic
+
+[routing:bootstrap_ro]
+socket = /var/snap/charmed-mysql/common/run/mysqlrouter/mysqlro.sock
+destinations = metadata-cache://cluster-set-35f57988bc107ceafce1854a03664d6b/?role=SECONDARY
+routing_strategy = round-robin-with-fallback
+protocol = classic
+
+[routing:bootstrap_x_rw]
+socket = /var/snap/charmed-mysql/common/run/mysqlrouter/mysqlx.sock
+destinations = metadata-cache://cluster-set-35f57988bc107ceafce1854a03664d6b/?role=PRIMARY
+routing_strategy = first-available
+protocol = x
+
+[routing:bootstrap_x_ro]
+socket = /var/snap/charmed-mysql/common/run/mysqlrouter/mysqlxro.sock
+destinations = metadata-cache://cluster-set-35f57988bc107ceafce1854a03664d6b/?role=SECONDARY
+routing_strategy = round-robin-with-fallback
+protocol = x
+
+[http_server]
+port = 8443
+bind_address = 127.0.0.1
+
+"""
+_SOCKET_DIRECTORY = pathlib.PurePath("/var/snap/charmed-mysql/common/run/mysqlrouter")
+
+
+def _configure_exposure(
+    tmp_path: pathlib.Path, is_charm_exposed: bool, config_file_text: str
+) -> typing.Optional[str]:
+    """Returns updated config file text or `None` if config could not be updated"""
+    file = tmp_path / "mysqlrouter.conf"
+    file.write_text(config_file_text)
+    config = router_config.RouterConfig(file)
+    if not machine_workload.AuthenticatedMachineWorkload._configure_exposure(
+        config, is_charm_exposed=is_charm_exposed, socket_directory=_SOCKET_DIRECTORY
+    ):
+        return
+    config.save()
+    return file.read_text()
+
+
+def _parse(config_file_text: str) -> configparser.ConfigParser:
+    config = configparser.ConfigParser()
+    config.read_string(config_file_text)
+    return config
+
+
+def test_expose(tmp_path):
+    config = _parse(_configure_exposure(tmp_path, True, _SOCKETS_CONFIG))
+    assert {
+        section_name: (section["bind_address"], section["bind_port"], "socket" in section)
+        for section_name, section in config.items()
+        if section_name.startswith("routing:")
+    } == {
+        "routing:bootstrap_rw": ("0.0.0.0", "6446", False),
+        "routing:bootstrap_ro": ("0.0.0.0", "6447", False),
+        "routing:bootstrap_x_rw": ("0.0.0.0", "6448", False),
+        "routing:bootstrap_x_ro": ("0.0.0.0", "6449", False),
+    }
+    # Other sections unchanged
+    assert config["http_server"]["bind_address"] == "127.0.0.1"
+    assert config["metadata_cache:bootstrap"]["user"] == "mysql_router1_hc3hpayqp2by"
+
+
+def test_expose_and_unexpose_round_trip(tmp_path):
+    exposed_config_file_text = _configure_exposure(tmp_path, True, _SOCKETS_CONFIG)
+    config = _parse(_configure_exposure(tmp_path, False, exposed_config_file_text))
+    expected_config = _parse(_SOCKETS_CONFIG)
+    assert {name: dict(section) for name, section in config.items()} == {
+        name: dict(section) for name, section in expected_config.items()
+    }
+
+
+@pytest.mark.parametrize("is_charm_exposed", [True, False])
+def test_unknown_routing_section(tmp_path, is_charm_exposed):
+    config_file_text = _SOCKETS_CONFIG + "[routing:custom]\nbind_port = 7000\n"
+    assert _configure_exposure(tmp_path, is_charm_exposed, config_file_text) is None
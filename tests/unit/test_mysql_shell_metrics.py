@@ -0,0 +1,65 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import mysql_shell.metrics as metrics
+
+
+def test_write_prometheus_file(monkeypatch, tmp_path):
+    monkeypatch.setattr(metrics, "_PROMETHEUS_DIRECTORY", tmp_path)
+    monkeypatch.setenv("JUJU_UNIT_NAME", "mysql-router/1")
+    monkeypatch.setattr(metrics, "_calls", [])
+    for _ in range(2):
+        metrics._calls.extend((
+            metrics.Call(
+                operation="delete_user",
+                duration_seconds=0.5,
+                execution_seconds=0.25,
+                mysql_error_code=1396,
+            ),
+            metrics.Call(
+                operation="delete_user",
+                duration_seconds=1.5,
+                startup_seconds=1,
+                execution_seconds=0.5,
+                exit_code=0,
+            ),
+        ))
+        # Counters are added to the existing file (one file per Juju hook)
+        metrics._write_prometheus_file()
+        assert metrics._calls == []
+    assert [path.name for path in tmp_path.iterdir()] == [
+        "mysql_router_charm_mysql_shell_mysql-router_1.prom"
+    ]
+    assert (tmp_path / "mysql_router_charm_mysql_shell_mysql-router_1.prom").read_text() == (
+        "# HELP mysql_router_charm_mysql_shell_calls_total MySQL Shell calls by the MySQL Router charm\n"
+        "# TYPE mysql_router_charm_mysql_shell_calls_total counter\n"
+        'mysql_router_charm_mysql_shell_calls_total{exit_code="",mysql_error_code="1396",operation="delete_user",unit="mysql-router/1"} 2.0\n'
+        'mysql_router_charm_mysql_shell_calls_total{exit_code="0",mysql_error_code="",operation="delete_user",unit="mysql-router/1"} 2.0\n'
+        "# HELP mysql_router_charm_mysql_shell_duration_seconds Duration of MySQL Shell calls by phase\n"
+        "# TYPE mysql_router_charm_mysql_shell_duration_seconds summary\n"
+        'mysql_router_charm_mysql_shell_duration_seconds_count{operation="delete_user",phase="execution",unit="mysql-router/1"} 4.0\n'
+        'mysql_router_charm_mysql_shell_duration_seconds_count{operation="delete_user",phase="startup",unit="mysql-router/1"} 2.0\n'
+        'mysql_router_charm_mysql_shell_duration_seconds_count{operation="delete_user",phase="total",unit="mysql-router/1"} 4.0\n'
+        'mysql_router_charm_mysql_shell_duration_seconds_sum{operation="delete_user",phase="execution",unit="mysql-router/1"} 1.5\n'
+        'mysql_router_charm_mysql_shell_duration_seconds_sum{operation="delete_user",phase="startup",unit="mysql-router/1"} 2.0\n'
+        'mysql_router_charm_mysql_shell_duration_seconds_sum{operation="delete_user",phase="total",unit="mysql-router/1"} 4.0\n'
+    )
+
+
+def test_write_prometheus_file_no_collector_directory(monkeypatch, tmp_path):
+    monkeypatch.setattr(metrics, "_PROMETHEUS_DIRECTORY", tmp_path / "node-exporter")
+    monkeypatch.setenv("JUJU_UNIT_NAME", "mysql-router/1")
+    monkeypatch.setattr(
+        metrics, "_calls", [metrics.Call(operation="delete_user", duration_seconds=0.5)]
+    )
+    metrics._write_prometheus_file()
+    assert metrics._calls == []
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_write_prometheus_file_no_calls(monkeypatch, tmp_path):
+    monkeypatch.setattr(metrics, "_PROMETHEUS_DIRECTORY", tmp_path)
+    monkeypatch.setenv("JUJU_UNIT_NAME", "mysql-router/1")
+    monkeypatch.setattr(metrics, "_calls", [])
+    metrics._write_prometheus_file()
+    assert list(tmp_path.iterdir()) == []
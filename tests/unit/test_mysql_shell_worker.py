@@ -0,0 +1,89 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import subprocess
+import sys
+import unittest.mock
+
+import pytest
+
+import mysql_shell
+
+# Consume password & tell charm that worker process is connected
+_READY = (
+    "import sys; sys.stdin.readline(); "
+    f"sys.stdout.write('{mysql_shell._RESULT_PREFIX}' + '{{\"ready\": true}}\\n'); "
+    "sys.stdout.flush(); "
+)
+
+
+def _start_worker(code: str) -> mysql_shell._Worker:
+    """Start fake MySQL Shell worker process that runs Python code."""
+    container_ = unittest.mock.MagicMock()
+    container_.start_mysql_shell.side_effect = lambda _: subprocess.Popen(
+        [sys.executable, "-c", code],
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        encoding="utf-8",
+    )
+    return mysql_shell._Worker(
+        container_=container_, connection_info=unittest.mock.MagicMock(password="password")
+    )
+
+
+def test_run():
+    # Password prompt (without newline), other output & result line written at once
+    worker = _start_worker(
+        _READY + "import time; sys.stdin.readline(); "
+        "sys.stdout.write('Please provide the password: Warning\\n"
+        f"{mysql_shell._RESULT_PREFIX}"
+        '{"output": 1, "error": null}\\n'
+        f"{mysql_shell._RESULT_PREFIX}"
+        '{"output": 2, "error": null}\\n'
+        "'); sys.stdout.flush(); time.sleep(10)"
+    )
+    # Result lines already read from pipe are returned without waiting for more output
+    assert worker.run({"code": ""}) == {"output": 1, "error": None}
+    assert worker.run({"code": ""}) == {"output": 2, "error": None}
+    worker._process.kill()
+    worker.close()
+
+
+def test_run_slow_request():
+    # Requests are not limited by the startup timeout
+    worker = _start_worker(
+        _READY + "import time; sys.stdin.readline(); time.sleep(0.5); "
+        f"sys.stdout.write('{mysql_shell._RESULT_PREFIX}' + '{{\"output\": 1}}\\n')"
+    )
+    worker._STARTUP_TIMEOUT = 0.1
+    assert worker.run({"code": ""}) == {"output": 1}
+    worker.close()
+
+
+def test_start_exited():
+    # e.g. authentication failed
+    with pytest.raises(mysql_shell._WorkerUnavailable):
+        _start_worker("import sys; sys.stderr.write('Access denied\\n'); sys.exit(1)")
+
+
+def test_start_timeout(monkeypatch):
+    monkeypatch.setattr(mysql_shell._Worker, "_STARTUP_TIMEOUT", 0.1)
+    with pytest.raises(mysql_shell._WorkerUnavailable):
+        _start_worker("import time; time.sleep(10)")
+
+
+def test_run_exited_before_request():
+    worker = _start_worker(_READY)
+    worker._process.wait()
+    with pytest.raises(mysql_shell._WorkerUnavailable):
+        worker.run({"code": ""})
+    worker.close()
+
+
+def test_run_exited_after_request():
+    worker = _start_worker(_READY + "sys.stdin.readline(); sys.stderr.write('Lost connection\\n')")
+    with pytest.raises(mysql_shell.WorkerRequestFailed):
+        worker.run({"code": ""})
+    worker.close()
+    assert worker.stderr == "Lost connection\n"
@@ -0,0 +1,82 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import ops
+import pytest
+
+import performance_profile
+import server_exceptions
+
+_GIB = 1024**3
+
+
+@pytest.mark.parametrize(
+    "resources,max_total_connections,max_idle_server_connections,net_buffer_length",
+    [
+        # Limited by memory
+        (
+            performance_profile.Resources(
+                cpu_count=2, memory_bytes=4 * _GIB, max_open_files=524288
+            ),
+            3276,
+            128,
+            16384,
+        ),
+        # Limited by open files
+        (
+            performance_profile.Resources(
+                cpu_count=64, memory_bytes=256 * _GIB, max_open_files=4096
+            ),
+            1920,
+            480,
+            32768,
+        ),
+        # Minimum (MySQL Router default)
+        (
+            performance_profile.Resources(
+                cpu_count=1, memory_bytes=_GIB // 2, max_open_files=1024
+            ),
+            512,
+            64,
+            16384,
+        ),
+    ],
+)
+def test_production(
+    resources, max_total_connections, max_idle_server_connections, net_buffer_length
+):
+    tuning = performance_profile.get_tuning(performance_profile.PRODUCTION, resources)
+    assert tuning.max_total_connections == max_total_connections
+    assert tuning.connection_pool_max_idle_server_connections == max_idle_server_connections
+    assert tuning.net_buffer_length == net_buffer_length
+    assert tuning.io_threads == resources.cpu_count
+
+
+def test_testing_independent_of_machine_size():
+    assert performance_profile.get_tuning(
+        performance_profile.TESTING,
+        performance_profile.Resources(cpu_count=1, memory_bytes=_GIB, max_open_files=1024),
+    ) == performance_profile.get_tuning(
+        performance_profile.TESTING,
+        performance_profile.Resources(cpu_count=64, memory_bytes=256 * _GIB, max_open_files=2**20),
+    )
+
+
+def test_invalid_profile():
+    with pytest.raises(server_exceptions.InvalidConfig) as exception_info:
+        performance_profile.get_tuning(
+            "foo",
+            performance_profile.Resources(cpu_count=1, memory_bytes=_GIB, max_open_files=1024),
+        )
+    assert isinstance(exception_info.value.status, ops.BlockedStatus)
+
+
+def test_from_machine():
+    resources = performance_profile.Resources.from_machine(max_open_files=4096)
+    assert resources.cpu_count >= 1
+    assert resources.memory_bytes > 0
+    assert resources.max_open_files == 4096
+
+
+def test_from_machine_unlimited_open_files():
+    assert performance_profile.Resources.from_machine(max_open_files=None).max_open_files == 2**20
@@ -0,0 +1,287 @@
+# Copyright 2023 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import pathlib
+
+import pytest
+
+import router_config
+
+
+@pytest.mark.parametrize(
+    "config_file_text,username",
+    [
+        (
+            """[DEFAULT]
+name = system
+keyring_path = /var/snap/charmed-mysql/64/var/lib/mysqlrouter/keyring
+master_key_path = /var/snap/charmed-mysql/64/etc/mysqlrouter/mysqlrouter.key
+connect_timeout = 5
+read_timeout = 30
+dynamic_state = /var/snap/charmed-mysql/64/var/lib/mysqlrouter/state.json
+client_ssl_cert = /var/snap/charmed-mysql/64/var/lib/mysqlrouter/router-cert.pem
+client_ssl_key = /var/snap/charmed-mysql/64/var/lib/mysqlrouter/router-key.pem
+client_ssl_mode = PREFERRED
+server_ssl_mode = PREFERRED
+server_ssl_verify = DISABLED
+unknown_config_option = error
+
+[logger]
+level = INFO
+
+[metadata_cache:bootstrap]
+cluster_type = gr
+router_id = 1
+user = mysql_router1_hc3hpayqp2by
+ttl = 5
+auth_cache_ttl = -1
+auth_cache_refresh_interval = 5
+use_gr_notifications = 1
+
+[routing:bootstrap_rw]
+bind_address = 127.0.0.1
+bind_port = 6446
+socket = /var/snap/charmed-mysql/common/run/mysqlrouter/mysql.sock
+destinations = metadata-cache://cluster-set-35f57988bc107ceafce1854a03664d6b/?role=PRIMARY
+routing_strategy = first-available
+protocol = classic
+
+[routing:bootstrap_ro]
+bind_address = 127.0.0.1
+bind_port = 6447
+socket = /var/snap/charmed-mysql/common/run/mysqlrouter/mysqlro.sock
+destinations = metadata-cache://cluster-set-35f57988bc107ceafce1854a03664d6b/?role=SECONDARY
+routing_strategy = round-robin-with-fallback
+protocol = classic
+
+[routing:bootstrap_x_rw]
+bind_address = 127.0.0.1
+bind_port = 6448
+socket = /var/snap/charmed-mysql/common/run/mysqlrouter/mysqlx.sock
+destinations = metadata-cache://cluster-set-35f57988bc107ceafce1854a03664d6b/?role=PRIMARY
+routing_strategy = first-available
+protocol = x
+
+[routing:bootstrap_x_ro]
+bind_address = 127.0.0.1
+bind_port = 6449
+socket = /var/snap/charmed-mysql/common/run/mysqlrouter/mysqlxro.sock
+destinations = metadata-cache://cluster-set-35f57988bc107ceafce1854a03664d6b/?role=SECONDARY
+routing_strategy = round-robin-with-fallback
+protocol = x
+
+[http_server]
+port = 8443
+ssl = 1
+ssl_cert = /var/snap/charmed-mysql/64/var/lib/mysqlrouter/router-cert.pem
+ssl_key = /var/snap/charmed-mysql/64/var/lib/mysqlrouter/router-key.pem
+bind_address = 127.0.0.1
+
+[http_auth_realm:default_auth_realm]
+backend = default_auth_backend
+method = basic
+name = default_realm
+
+[rest_router]
+require_realm = default_auth_realm
+
+[rest_api]
+
+[http_auth_backend:default_auth_backend]
+backend = metadata_cache
+
+[rest_routing]
+require_realm = default_auth_realm
+
+[rest_metadata_cache]
+require_realm = default_auth_realm
+
+""",
+            "mysql_router1_hc3hpayqp2by",
+        ),
+        (
+            """# File automatically generated during MySQL Router bootstrap
+[DEFAULT]
+name=system
+keyring_path=/var/lib/mysqlrouter/keyring
+master_key_path=/etc/mysqlrouter/mysqlrouter.key
+connect_timeout=5
+read_timeout=30
+dynamic_state=/var/lib/mysqlrouter/state.json
+client_ssl_cert=/var/lib/mysqlrouter/router-cert.pem
+client_ssl_key=/var/lib/mysqlrouter/router-key.pem
+client_ssl_mode=PREFERRED
+server_ssl_mode=AS_CLIENT
+server_ssl_verify=DISABLED
+unknown_config_option=error
+
+[logger]
+level=INFO
+
+[metadata_cache:bootstrap]
+cluster_type=gr
+router_id=1
+user=mysql_router1_t0kj7qvusegl
+ttl=5
+auth_cache_ttl=-1
+auth_cache_refresh_interval=5
+use_gr_notifications=1
+
+[routing:bootstrap_rw]
+bind_address=0.0.0.0
+bind_port=6446
+destinations=metadata-cache://cluster-set-2137eca38547ab65bdaecb2833dedaf3/?role=PRIMARY
+routing_strategy=first-available
+protocol=classic
+
+[routing:bootstrap_ro]
+bind_address=0.0.0.0
+bind_port=6447
+destinations=metadata-cache://cluster-set-2137eca38547ab65bdaecb2833dedaf3/?role=SECONDARY
+routing_strategy=round-robin-with-fallback
+protocol=classic
+
+[routing:bootstrap_x_rw]
+bind_address=0.0.0.0
+bind_port=6448
+destinations=metadata-cache://cluster-set-2137eca38547ab65bdaecb2833dedaf3/?role=PRIMARY
+routing_strategy=first-available
+protocol=x
+
+[routing:bootstrap_x_ro]
+bind_address=0.0.0.0
+bind_port=6449
+destinations=metadata-cache://cluster-set-2137eca38547ab65bdaecb2833dedaf3/?role=SECONDARY
+routing_strategy=round-robin-with-fallback
+protocol=x
+
+[http_server]
+port=8443
+ssl=1
+ssl_cert=/var/lib/mysqlrouter/router-cert.pem
+ssl_key=/var/lib/mysqlrouter/router-key.pem
+bind_address=127.0.0.1
+
+[http_auth_realm:default_auth_realm]
+backend=default_auth_backend
+method=basic
+name=default_realm
+
+[rest_router]
+require_realm=default_auth_realm
+
+[rest_api]
+
+[http_auth_backend:default_auth_backend]
+backend=metadata_cache
+
+[rest_routing]
+require_realm=default_auth_realm
+
+[rest_metadata_cache]
+require_realm=default_auth_realm
+
+""",
+            "mysql_router1_t0kj7qvusegl",
+        ),
+    ],
+)
+def test_parse_username_from_config(tmp_path, config_file_text, username):
+    file = tmp_path / "mysqlrouter.conf"
+    file.write_text(config_file_text)
+    assert router_config.RouterConfig(file).username == username
+
+
+_CONFIG_FILE_TEXT = """# File automatically generated during MySQL Router bootstrap
+[DEFAULT]
+name=system
+server_ssl_mode=AS_CLIENT
+
+[metadata_cache:bootstrap]
+user=mysql_router1_t0kj7qvusegl
+
+[routing:bootstrap_rw]
+bind_address=0.0.0.0
+bind_port=6446
+protocol=classic
+
+[http_server]
+port=8443
+"""
+
+
+def _load(tmp_path: pathlib.Path, text: str = _CONFIG_FILE_TEXT) -> router_config.RouterConfig:
+    file = tmp_path / "mysqlrouter.conf"
+    file.write_text(text)
+    return router_config.RouterConfig(file)
+
+
+def test_get(tmp_path):
+    config = _load(tmp_path)
+    assert config.sections == [
+        "DEFAULT",
+        "metadata_cache:bootstrap",
+        "routing:bootstrap_rw",
+        "http_server",
+    ]
+    assert config.routes == ["routing:bootstrap_rw"]
+    assert config.get("routing:bootstrap_rw", "bind_port") == "6446"
+    assert config.get("routing:bootstrap_rw", "socket") is None
+    # DEFAULT section not inherited
+    assert config.get("http_server", "name") is None
+
+
+def test_save_unchanged(tmp_path):
+    config = _load(tmp_path)
+    config.set("routing:bootstrap_rw", "bind_port", "6446")
+    config.remove("routing:bootstrap_rw", "socket")
+    (tmp_path / "mysqlrouter.conf").unlink()
+    config.save()
+    assert not (tmp_path / "mysqlrouter.conf").exists()
+
+
+def test_save_preserves_formatting(tmp_path):
+    config = _load(tmp_path)
+    config.set("routing:bootstrap_rw", "bind_address", "127.0.0.1")
+    config.remove("routing:bootstrap_rw", "bind_port")
+    config.set("routing:bootstrap_rw", "socket", "/run/mysqlrouter/mysql.sock")
+    config.set("connection_pool", "max_idle_server_connections", "64")
+    config.save()
+    assert (tmp_path / "mysqlrouter.conf").read_text() == _CONFIG_FILE_TEXT.replace(
+        "bind_address=0.0.0.0\nbind_port=6446\nprotocol=classic\n",
+        "bind_address=127.0.0.1\nprotocol=classic\nsocket=/run/mysqlrouter/mysql.sock\n",
+    ) + "\n[connection_pool]\nmax_idle_server_connections=64\n"
+
+
+def test_update(tmp_path):
+    config = _load(tmp_path)
+    config.update({
+        router_config.DEFAULT: {"max_total_connections": "1024", "server_ssl_mode": None},
+        router_config.ALL_ROUTES: {"max_connections": "100"},
+        router_config.CONNECTION_POOL: {"idle_timeout": "5"},
+    })
+    assert config.save() is True
+    assert config.get(router_config.DEFAULT, "max_total_connections") == "1024"
+    assert config.get(router_config.DEFAULT, "server_ssl_mode") is None
+    assert config.get("routing:bootstrap_rw", "max_connections") == "100"
+    assert config.get(router_config.CONNECTION_POOL, "idle_timeout") == "5"
+    config.update({router_config.ALL_ROUTES: {"max_connections": "100"}})
+    assert config.save() is False
+
+
+def test_update_read_only_routes(tmp_path):
+    config = _load(
+        tmp_path,
+        """[routing:bootstrap_rw]
+destinations=metadata-cache://cluster-set-2137eca38547ab65bdaecb2833dedaf3/?role=PRIMARY
+routing_strategy=first-available
+
+[routing:bootstrap_ro]
+destinations=metadata-cache://cluster-set-2137eca38547ab65bdaecb2833dedaf3/?role=SECONDARY
+routing_strategy=round-robin-with-fallback
+""",
+    )
+    assert config.read_only_routes == ["routing:bootstrap_ro"]
+    config.update({router_config.ALL_READ_ONLY_ROUTES: {"routing_strategy": "round-robin"}})
+    assert config.get("routing:bootstrap_rw", "routing_strategy") == "first-available"
+    assert config.get("routing:bootstrap_ro", "routing_strategy") == "round-robin"
@@ -0,0 +1,42 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import pytest
+
+import snap
+
+
+@pytest.mark.parametrize(
+    "before,after",
+    [
+        (
+            "keyring_path=/var/snap/charmed-mysql/64/var/lib/mysqlrouter/keyring\n",
+            "keyring_path=/var/snap/charmed-mysql/current/var/lib/mysqlrouter/keyring\n",
+        ),
+        # Locally installed revision
+        (
+            "logging_folder=/var/snap/charmed-mysql/x1/var/log/mysqlrouter\n",
+            "logging_folder=/var/snap/charmed-mysql/current/var/log/mysqlrouter\n",
+        ),
+        # Paths that do not include the revision
+        (
+            "socket=/var/snap/charmed-mysql/common/run/mysqlrouter/mysql.sock\n"
+            "dynamic_state=/var/snap/charmed-mysql/current/var/lib/mysqlrouter/state.json\n",
+            "socket=/var/snap/charmed-mysql/common/run/mysqlrouter/mysql.sock\n"
+            "dynamic_state=/var/snap/charmed-mysql/current/var/lib/mysqlrouter/state.json\n",
+        ),
+    ],
+)
+def test_update_revision_in_router_config_file(monkeypatch, tmp_path, before, after):
+    config_file = tmp_path / "mysqlrouter.conf"
+    config_file.write_text(f"[DEFAULT]\n{before}")
+    monkeypatch.setattr("snap.Snap.router_config_file", config_file)
+    container_ = snap.Snap(unit_name="mysql-router/0")
+    container_._update_revision_in_router_config_file()
+    assert config_file.read_text() == f"[DEFAULT]\n{after}"
+
+
+def test_update_revision_in_router_config_file_missing(monkeypatch, tmp_path):
+    monkeypatch.setattr("snap.Snap.router_config_file", tmp_path / "mysqlrouter.conf")
+    snap.Snap(unit_name="mysql-router/0")._update_revision_in_router_config_file()
+    assert not (tmp_path / "mysqlrouter.conf").exists()
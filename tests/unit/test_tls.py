@@ -0,0 +1,36 @@
+# Copyright 2024 Canonical Ltd.
+# See LICENSE file for licensing details.
+
+import cryptography.hazmat.primitives.serialization as serialization
+import pytest
+from cryptography.hazmat.primitives.asymmetric import ec, rsa
+
+import relations.tls
+import server_exceptions
+
+
+@pytest.mark.parametrize(
+    "algorithm,key_type,key_size",
+    [
+        ("rsa", rsa.RSAPrivateKey, 2048),
+        ("ecdsa-p256", ec.EllipticCurvePrivateKey, 256),
+        ("ecdsa-p384", ec.EllipticCurvePrivateKey, 384),
+    ],
+)
+def test_generate_private_key(algorithm, key_type, key_size):
+    key = serialization.load_pem_private_key(
+        relations.tls._generate_private_key(algorithm).encode("utf-8"), password=None
+    )
+    assert isinstance(key, key_type)
+    assert key.key_size == key_size
+
+
+def test_generate_private_key_invalid_algorithm():
+    with pytest.raises(server_exceptions.InvalidConfig):
+        relations.tls._generate_private_key("dsa")
+
+
+def test_check_key_algorithm():
+    relations.tls._check_key_algorithm("ecdsa-p256")
+    with pytest.raises(server_exceptions.InvalidConfig):
+        relations.tls._check_key_algorithm("dsa")
@@ -1,188 +1,203 @@
-# Copyright 2023 Canonical Ltd.
+# Copyright 2024 Canonical Ltd.
 # See LICENSE file for licensing details.
 
+import dataclasses
+import types
+import unittest.mock
+
+import ops
 import pytest
 
+import router_config
+import server_exceptions
 import workload
 
+_PROC_NET_TCP = """  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode
+   0: 0100007F:192E 00000000:0000 0A 00000000:00000000 00:00000000 00000000   584        0 31204 1 0000000000000000 100 0 0 10 0
+   1: 0100007F:192E 0100007F:D8A2 01 00000000:00000000 00:00000000 00000000   584        0 31980 1 0000000000000000 20 4 30 10 -1
+   2: 0100007F:192F 0100007F:D8A4 01 00000000:00000000 00:00000000 00000000   584        0 31981 1 0000000000000000 20 4 30 10 -1
+   3: 0100007F:D8A6 0100007F:192E 01 00000000:00000000 00:00000000 00000000     0        0 31982 1 0000000000000000 20 4 30 10 -1
+   4: 0100007F:192E 0100007F:D8A8 06 00000000:00000000 03:00000000 00000000     0        0 0 3 0000000000000000
+"""
+
+_PROC_NET_UNIX = """Num       RefCount Protocol Flags    Type St Inode Path
+0000000000000000: 00000002 00000000 00010000 0001 01 41012 /var/snap/charmed-mysql/common/run/mysqlrouter/mysql.sock
+0000000000000000: 00000003 00000000 00000000 0001 03 41115 /var/snap/charmed-mysql/common/run/mysqlrouter/mysql.sock
+0000000000000000: 00000003 00000000 00000000 0001 03 41116 /var/snap/charmed-mysql/common/run/mysqlrouter/mysqlro.sock
+0000000000000000: 00000003 00000000 00000000 0001 03 41117
+0000000000000000: 00000003 00000000 00000000 0001 03 41118 /run/systemd/journal/stdout
+"""
+
+
+def test_count_tcp_connections():
+    # Port 6446 (0x192E): 1 established connection (listening socket, outgoing connection from
+    # local client & connection in TIME_WAIT state not counted)
+    assert workload._count_tcp_connections(_PROC_NET_TCP, ports={6446}) == 1
+    assert workload._count_tcp_connections(_PROC_NET_TCP, ports={6446, 6447}) == 2
+    assert workload._count_tcp_connections(_PROC_NET_TCP, ports={6448}) == 0
+
+
+def test_count_unix_socket_connections():
+    assert (
+        workload._count_unix_socket_connections(
+            _PROC_NET_UNIX,
+            paths={
+                "/var/snap/charmed-mysql/common/run/mysqlrouter/mysql.sock",
+                "/var/snap/charmed-mysql/common/run/mysqlrouter/mysqlro.sock",
+            },
+        )
+        == 2
+    )
+
+
+@pytest.fixture
+def authenticated_workload(tmp_path):
+    container_ = unittest.mock.MagicMock()
+    container_.router_config_directory = tmp_path
+    container_.installed_revision = "1"
+    container_.mysql_router_service_max_open_files = 524288
+    container_.mysql_router_service_enabled = True
+    container_.mysql_router_exporter_service_enabled = False
+    container_.router_config.save.return_value = False
+    charm_ = unittest.mock.MagicMock()
+    charm_.is_externally_accessible.return_value = False
+    charm_.config = {"profile": "testing", "read-only-routing-strategy": "round-robin"}
+    return workload.AuthenticatedWorkload(
+        container_=container_,
+        logrotate_=unittest.mock.MagicMock(),
+        connection_info=types.SimpleNamespace(host="10.0.0.1", port="3306"),
+        cos=unittest.mock.MagicMock(),
+        charm_=charm_,
+    )
+
+
+# Same fields as `relations.cos.ExporterConfig` (importing `relations.cos` requires snapd)
+_EXPORTER_CONFIG = dataclasses.make_dataclass(
+    "ExporterConfig", ["url", "username", "password", "listen_port"]
+)("https://127.0.0.1:8443/api/20190715", "monitoring", "password", "9152")
+
+
+def _reconcile(workload_: workload.AuthenticatedWorkload) -> None:
+    workload_.reconcile(event=None, tls=False, unit_name="mysql-router/0", exporter_config=None)
+
+
+def test_reconcile_skipped_if_state_unchanged(authenticated_workload):
+    _reconcile(authenticated_workload)
+    authenticated_workload._container.reset_mock()
+    _reconcile(authenticated_workload)
+    # No files read or written & no services checked or updated
+    assert authenticated_workload._container.mock_calls == []
+
+
+def test_reconcile_runs_if_state_changed(authenticated_workload):
+    _reconcile(authenticated_workload)
+    # e.g. snap refreshed to new revision with same MySQL Router version
+    authenticated_workload._container.installed_revision = "2"
+    authenticated_workload._container.reset_mock()
+    _reconcile(authenticated_workload)
+    authenticated_workload._container.router_config.update.assert_called()
+
+
+def test_reconcile_runs_if_service_stopped(authenticated_workload):
+    _reconcile(authenticated_workload)
+    # e.g. MySQL Router crashed or `snap stop` was run manually
+    authenticated_workload._container.mysql_router_service_enabled = False
+    authenticated_workload._enable_router = unittest.mock.MagicMock()
+    _reconcile(authenticated_workload)
+    authenticated_workload._enable_router.assert_called_once()
+
+
+def test_reconcile_runs_if_exporter_service_stopped(authenticated_workload):
+    authenticated_workload._enable_exporter = unittest.mock.MagicMock()
+    authenticated_workload._container.mysql_router_exporter_service_enabled = True
+    authenticated_workload.reconcile(
+        event=None, tls=False, unit_name="mysql-router/0", exporter_config=_EXPORTER_CONFIG
+    )
+    authenticated_workload._container.mysql_router_exporter_service_enabled = False
+    authenticated_workload.reconcile(
+        event=None, tls=False, unit_name="mysql-router/0", exporter_config=_EXPORTER_CONFIG
+    )
+    authenticated_workload._enable_exporter.assert_called_once()
+
+
+def test_reconcile_certificate_authority_changed(authenticated_workload, tmp_path):
+    authenticated_workload._container.tls_config_file = tmp_path / "tls.cnf"
+    authenticated_workload._container.mysql_router_exporter_service_enabled = True
+    authenticated_workload._restart = unittest.mock.MagicMock()
+    authenticated_workload._enable_exporter = unittest.mock.MagicMock()
+
+    def reconcile(certificate_authority: str) -> None:
+        authenticated_workload.reconcile(
+            event=None,
+            tls=True,
+            unit_name="mysql-router/0",
+            exporter_config=_EXPORTER_CONFIG,
+            key="key",
+            certificate="certificate",
+            certificate_authority=certificate_authority,
+        )
+
+    reconcile("certificate-authority")
+    authenticated_workload._restart.assert_called_once()
+    authenticated_workload._restart.reset_mock()
+    authenticated_workload._enable_exporter.reset_mock()
+    # MySQL Router does not read the certificate authority—only the exporter is restarted
+    reconcile("new-certificate-authority")
+    authenticated_workload._restart.assert_not_called()
+    authenticated_workload._enable_exporter.assert_called_once()
+
+
+@pytest.mark.parametrize(
+    "version_before_upgrade,version_output,bootstrap_required",
+    [
+        ("8.0.40", "Ver 8.0.41 for Linux on x86_64 (MySQL Community - GPL)", False),
+        ("8.0.41", "Ver 8.0.41 for Linux on x86_64 (MySQL Community - GPL)", False),
+        ("8.0.41", "Ver 8.4.4 for Linux on x86_64 (MySQL Community - GPL)", True),
+    ],
+)
+def test_bootstrap_required_after_upgrade(
+    authenticated_workload, version_before_upgrade, version_output, bootstrap_required
+):
+    authenticated_workload._container.router_config.exists = True
+    authenticated_workload._container.run_mysql_router.return_value = version_output
+    assert (
+        authenticated_workload._bootstrap_required_after_upgrade(
+            version_before_upgrade=version_before_upgrade
+        )
+        is bootstrap_required
+    )
+
+
+def test_bootstrap_required_after_upgrade_config_missing(authenticated_workload):
+    authenticated_workload._container.router_config.exists = False
+    assert authenticated_workload._bootstrap_required_after_upgrade(
+        version_before_upgrade="8.0.41"
+    )
+
 
 @pytest.mark.parametrize(
-    "config_file_text,username",
+    "config",
     [
-        (
-            """[DEFAULT]
-name = system
-keyring_path = /var/snap/charmed-mysql/64/var/lib/mysqlrouter/keyring
-master_key_path = /var/snap/charmed-mysql/64/etc/mysqlrouter/mysqlrouter.key
-connect_timeout = 5
-read_timeout = 30
-dynamic_state = /var/snap/charmed-mysql/64/var/lib/mysqlrouter/state.json
-client_ssl_cert = /var/snap/charmed-mysql/64/var/lib/mysqlrouter/router-cert.pem
-client_ssl_key = /var/snap/charmed-mysql/64/var/lib/mysqlrouter/router-key.pem
-client_ssl_mode = PREFERRED
-server_ssl_mode = PREFERRED
-server_ssl_verify = DISABLED
-unknown_config_option = error
-
-[logger]
-level = INFO
-
-[metadata_cache:bootstrap]
-cluster_type = gr
-router_id = 1
-user = mysql_router1_hc3hpayqp2by
-ttl = 5
-auth_cache_ttl = -1
-auth_cache_refresh_interval = 5
-use_gr_notifications = 1
-
-[routing:bootstrap_rw]
-bind_address = 127.0.0.1
-bind_port = 6446
-socket = /var/snap/charmed-mysql/common/run/mysqlrouter/mysql.sock
-destinations = metadata-cache://cluster-set-35f57988bc107ceafce1854a03664d6b/?role=PRIMARY
-routing_strategy = first-available
-protocol = classic
-
-[routing:bootstrap_ro]
-bind_address = 127.0.0.1
-bind_port = 6447
-socket = /var/snap/charmed-mysql/common/run/mysqlrouter/mysqlro.sock
-destinations = metadata-cache://cluster-set-35f57988bc107ceafce1854a03664d6b/?role=SECONDARY
-routing_strategy = round-robin-with-fallback
-protocol = classic
-
-[routing:bootstrap_x_rw]
-bind_address = 127.0.0.1
-bind_port = 6448
-socket = /var/snap/charmed-mysql/common/run/mysqlrouter/mysqlx.sock
-destinations = metadata-cache://cluster-set-35f57988bc107ceafce1854a03664d6b/?role=PRIMARY
-routing_strategy = first-available
-protocol = x
-
-[routing:bootstrap_x_ro]
-bind_address = 127.0.0.1
-bind_port = 6449
-socket = /var/snap/charmed-mysql/common/run/mysqlrouter/mysqlxro.sock
-destinations = metadata-cache://cluster-set-35f57988bc107ceafce1854a03664d6b/?role=SECONDARY
-routing_strategy = round-robin-with-fallback
-protocol = x
-
-[http_server]
-port = 8443
-ssl = 1
-ssl_cert = /var/snap/charmed-mysql/64/var/lib/mysqlrouter/router-cert.pem
-ssl_key = /var/snap/charmed-mysql/64/var/lib/mysqlrouter/router-key.pem
-bind_address = 127.0.0.1
-
-[http_auth_realm:default_auth_realm]
-backend = default_auth_backend
-method = basic
-name = default_realm
-
-[rest_router]
-require_realm = default_auth_realm
-
-[rest_api]
-
-[http_auth_backend:default_auth_backend]
-backend = metadata_cache
-
-[rest_routing]
-require_realm = default_auth_realm
-
-[rest_metadata_cache]
-require_realm = default_auth_realm
-
-""",
-            "mysql_router1_hc3hpayqp2by",
-        ),
-        (
-            """# File automatically generated during MySQL Router bootstrap
-[DEFAULT]
-name=system
-keyring_path=/var/lib/mysqlrouter/keyring
-master_key_path=/etc/mysqlrouter/mysqlrouter.key
-connect_timeout=5
-read_timeout=30
-dynamic_state=/var/lib/mysqlrouter/state.json
-client_ssl_cert=/var/lib/mysqlrouter/router-cert.pem
-client_ssl_key=/var/lib/mysqlrouter/router-key.pem
-client_ssl_mode=PREFERRED
-server_ssl_mode=AS_CLIENT
-server_ssl_verify=DISABLED
-unknown_config_option=error
-
-[logger]
-level=INFO
-
-[metadata_cache:bootstrap]
-cluster_type=gr
-router_id=1
-user=mysql_router1_t0kj7qvusegl
-ttl=5
-auth_cache_ttl=-1
-auth_cache_refresh_interval=5
-use_gr_notifications=1
-
-[routing:bootstrap_rw]
-bind_address=0.0.0.0
-bind_port=6446
-destinations=metadata-cache://cluster-set-2137eca38547ab65bdaecb2833dedaf3/?role=PRIMARY
-routing_strategy=first-available
-protocol=classic
-
-[routing:bootstrap_ro]
-bind_address=0.0.0.0
-bind_port=6447
-destinations=metadata-cache://cluster-set-2137eca38547ab65bdaecb2833dedaf3/?role=SECONDARY
-routing_strategy=round-robin-with-fallback
-protocol=classic
-
-[routing:bootstrap_x_rw]
-bind_address=0.0.0.0
-bind_port=6448
-destinations=metadata-cache://cluster-set-2137eca38547ab65bdaecb2833dedaf3/?role=PRIMARY
-routing_strategy=first-available
-protocol=x
-
-[routing:bootstrap_x_ro]
-bind_address=0.0.0.0
-bind_port=6449
-destinations=metadata-cache://cluster-set-2137eca38547ab65bdaecb2833dedaf3/?role=SECONDARY
-routing_strategy=round-robin-with-fallback
-protocol=x
-
-[http_server]
-port=8443
-ssl=1
-ssl_cert=/var/lib/mysqlrouter/router-cert.pem
-ssl_key=/var/lib/mysqlrouter/router-key.pem
-bind_address=127.0.0.1
-
-[http_auth_realm:default_auth_realm]
-backend=default_auth_backend
-method=basic
-name=default_realm
-
-[rest_router]
-require_realm=default_auth_realm
-
-[rest_api]
-
-[http_auth_backend:default_auth_backend]
-backend=metadata_cache
-
-[rest_routing]
-require_realm=default_auth_realm
-
-[rest_metadata_cache]
-require_realm=default_auth_realm
-
-""",
-            "mysql_router1_t0kj7qvusegl",
-        ),
+        {"read-only-routing-strategy": "random"},
+        {"read-only-routing-strategy": "round-robin", "io-backend": "select"},
+        {"read-only-routing-strategy": "round-robin", "client-ssl-mode": "VERIFY_CA"},
+        {
+            "read-only-routing-strategy": "round-robin",
+            "client-ssl-mode": "PASSTHROUGH",
+            "server-ssl-mode": "REQUIRED",
+        },
     ],
 )
-def test_parse_username_from_config(config_file_text, username):
-    assert workload.AuthenticatedWorkload._parse_username_from_config(config_file_text) == username
+def test_invalid_config(authenticated_workload, config):
+    authenticated_workload._charm.config.update(config)
+    with pytest.raises(server_exceptions.InvalidConfig) as exception_info:
+        authenticated_workload._get_router_options(is_charm_exposed=False)
+    assert isinstance(exception_info.value.status, ops.BlockedStatus)
+
+
+def test_router_options_per_route(authenticated_workload):
+    options = authenticated_workload._get_router_options(is_charm_exposed=False)
+    # Not supported in `[DEFAULT]` section (bootstrap sets `unknown_config_option=error`)
+    for option in ("max_connections", "client_connect_timeout", "net_buffer_length"):
+        assert option in options[router_config.ALL_ROUTES]
+        assert option not in options[router_config.DEFAULT]